@@ -0,0 +1,68 @@
+"""두 부하 테스트 결과(JSON) 비교
+
+    python -m bench.compare bench/results/abc1234.json bench/results/def5678.json --fail-over 10
+
+--fail-over 를 주면 p95 가 그 비율(%) 넘게 나빠진 엔드포인트가 있을 때 종료 코드 1 로 끝난다.
+"""
+import argparse
+import json
+import sys
+
+
+def _change(base, new) -> str:
+    if base is None or new is None:
+        return "-"
+    if not base:
+        return f"{new}"
+    return f"{new} ({(new - base) / base * 100:+.1f}%)"
+
+
+def compare(base: dict, new: dict) -> tuple[list[str], list[tuple]]:
+    lines = [f"{base['meta'].get('commit')} → {new['meta'].get('commit')}"]
+    p95s = []
+
+    header = f"{'endpoint':<16} {'rps':>18} {'p50 ms':>18} {'p95 ms':>18} {'p99 ms':>18} {'queries':>14}"
+    lines.append(header)
+    for name, n in new["endpoints"].items():
+        b = base["endpoints"].get(name)
+        if b is None:
+            lines.append(f"{name:<16} (새 시나리오)")
+            continue
+        lines.append(
+            f"{name:<16} {_change(b['throughput_rps'], n['throughput_rps']):>18}"
+            f" {_change(b['latency_ms']['p50'], n['latency_ms']['p50']):>18}"
+            f" {_change(b['latency_ms']['p95'], n['latency_ms']['p95']):>18}"
+            f" {_change(b['latency_ms']['p99'], n['latency_ms']['p99']):>18}"
+            f" {_change(b['queries_per_request'], n['queries_per_request']):>14}"
+        )
+        p95s.append((name, b["latency_ms"]["p95"], n["latency_ms"]["p95"]))
+    return lines, p95s
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트 결과 비교")
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--fail-over", type=float, help="p95 악화 허용 비율 (%%)")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+
+    lines, p95s = compare(base, new)
+    print("\n".join(lines))
+
+    if args.fail_over is not None:
+        failed = [
+            name for name, before, after in p95s
+            if before and after and (after - before) / before * 100 > args.fail_over
+        ]
+        if failed:
+            print(f"p95 가 {args.fail_over}% 넘게 나빠짐: {', '.join(failed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
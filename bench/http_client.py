@@ -0,0 +1,88 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+
+class HttpClient:
+    """keep-alive 커넥션 하나를 쓰는 최소한의 HTTP/1.1 클라이언트 (벤치마크 전용)
+
+    키오스크 한 대처럼 요청을 하나씩 순서대로 보낸다. 외부 라이브러리를 쓰지 않아
+    클라이언트 쪽 오버헤드가 측정에 섞이는 것을 줄인다.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        url = urlsplit(base_url)
+        if url.scheme != "http":
+            raise ValueError("http:// 주소만 지원합니다")
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._reader = self._writer = None
+
+    async def request(self, method: str, path: str, body=None) -> tuple[int, bytes]:
+        payload = b"" if body is None else json.dumps(body).encode()
+        head = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            f"Content-Length: {len(payload)}",
+        ]
+        if body is not None:
+            head.append("Content-Type: application/json")
+        message = ("\r\n".join(head) + "\r\n\r\n").encode() + payload
+
+        # 서버가 유휴 커넥션을 닫았으면 한 번 다시 연결
+        for attempt in range(2):
+            reused = self._writer is not None
+            if not reused:
+                await self._connect()
+            try:
+                self._writer.write(message)
+                await self._writer.drain()
+                return await asyncio.wait_for(self._read_response(), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if not reused or attempt:
+                    raise
+
+    async def _read_response(self) -> tuple[int, bytes]:
+        status_line = await self._reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self._reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self._reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readexactly(2)
+            body = b"".join(chunks)
+        else:
+            body = await self._reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, body
@@ -0,0 +1,274 @@
+"""키오스크 주요 흐름 부하 테스트
+
+    # 1) 데이터 적재, 2) 서버 실행 (쿼리 수를 정확히 보려면 워커 1개), 3) 부하
+    PYTHONPATH=src python -m bench.seed --members 100000 --truncate
+    PYTHONPATH=src uvicorn main:app --workers 1
+    PYTHONPATH=src python -m bench.run --duration 60 --concurrency 32 --output bench/results/$(git rev-parse --short HEAD).json
+
+결과는 엔드포인트별 처리량, p50/p95/p99 지연 시간, 요청당 쿼리 수(/metrics)를 담은 JSON 이며
+bench.compare 로 두 커밋의 결과를 비교할 수 있다.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import asyncpg
+
+from bench.http_client import HttpClient
+from database.synthetic import asyncpg_dsn
+from core.config import settings
+
+# 이름: (메서드, /metrics 라우트, 기본 비중)
+SCENARIOS = {
+    "log-in": ("POST", "/users/log-in", 25),
+    "check-in": ("POST", "/users/check-in", 25),
+    "reserve": ("POST", "/facility/reserve", 15),
+    "multi-confirm": ("POST", "/facility/multi-confirm", 10),
+    "facility-status": ("GET", "/facility/facilities/status", 15),
+    "board": ("GET", "/board", 10),
+}
+
+
+class Workload:
+    """적재된 데이터에서 뽑은 회원/시설로 시나리오별 요청 생성"""
+
+    def __init__(self, rng: random.Random, members: list[tuple], facility_ids: list[int]):
+        self.rng = rng
+        self.members = members
+        self.facility_ids = facility_ids
+
+    @classmethod
+    async def load(cls, rng: random.Random, sample_size: int) -> "Workload":
+        conn = await asyncpg.connect(asyncpg_dsn(settings.POSTGRES_DATABASE_URL))
+        try:
+            # 매번 같은 회원을 고르도록 member_id 순서로 뽑은 뒤 섞음
+            rows = await conn.fetch(
+                "SELECT name, birth, phone_num FROM users ORDER BY member_id LIMIT $1", sample_size * 10
+            )
+            facility_ids = [r["id"] for r in await conn.fetch("SELECT id FROM facility ORDER BY id")]
+        finally:
+            await conn.close()
+        if not rows or not facility_ids:
+            raise SystemExit("회원/시설 데이터가 없습니다. 먼저 python -m bench.seed 를 실행하세요")
+
+        members = [(r["name"], r["birth"].isoformat(), r["phone_num"]) for r in rows]
+        return cls(rng, rng.sample(members, min(sample_size, len(members))), facility_ids)
+
+    def build(self, scenario: str) -> tuple[str, str, dict | None]:
+        method, path, _ = SCENARIOS[scenario]
+        name, birth, phone = self.rng.choice(self.members)
+
+        if scenario in ("log-in", "check-in"):
+            return method, path, {"name": name, "birth": birth}
+        if scenario == "reserve":
+            return method, path, {"facility_id": self.rng.choice(self.facility_ids), "name": name, "birth": birth}
+        if scenario == "multi-confirm":
+            group = self.rng.sample(self.members, self.rng.randint(2, 4))
+            return method, path, {
+                "facility_id": self.rng.choice(self.facility_ids),
+                "members": [{"name": n, "birth": b, "phone": p} for n, b, p in group]
+            }
+        if scenario == "board":
+            return method, f"{path}?size=20", None
+        return method, path, None
+
+
+# ------------------- /metrics -------------------
+_METRIC_LINE = re.compile(r'^(http_request_db_(?:queries|seconds)_(?:sum|count))\{method="(\w+)",route="([^"]*)"\} (\S+)$')
+
+
+async def scrape_db_metrics(base_url: str) -> dict[tuple[str, str], dict[str, float]]:
+    """(method, route) → {http_request_db_queries_sum: .., ..._count: .., ...}"""
+    client = HttpClient(base_url)
+    try:
+        status, body = await client.request("GET", "/metrics")
+    finally:
+        await client.close()
+    if status != 200:
+        return {}
+
+    metrics = {}
+    for line in body.decode().splitlines():
+        match = _METRIC_LINE.match(line)
+        if match:
+            name, method, route, value = match.groups()
+            metrics.setdefault((method, route), {})[name] = float(value)
+    return metrics
+
+
+def db_usage(before: dict, after: dict, method: str, route: str) -> dict:
+    start, end = before.get((method, route), {}), after.get((method, route), {})
+
+    def delta(name):
+        return end.get(name, 0) - start.get(name, 0)
+
+    count = delta("http_request_db_queries_count")
+    if not count:
+        return {"queries_per_request": None, "db_ms_per_request": None}
+    return {
+        "queries_per_request": round(delta("http_request_db_queries_sum") / count, 2),
+        "db_ms_per_request": round(delta("http_request_db_seconds_sum") / count * 1000, 3),
+    }
+
+
+# ------------------- 부하 -------------------
+def percentile(sorted_values: list[float], p: float) -> float | None:
+    if not sorted_values:
+        return None
+    # nearest-rank
+    index = min(len(sorted_values) - 1, max(0, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "mean": round(sum(values) / len(values), 3) if values else None,
+            "max": values[-1] if values else None,
+        },
+    }
+
+
+async def worker(client: HttpClient, workload: Workload, mix: list[tuple[str, int]], deadline: float,
+                 measure_from: float, results: dict):
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    while time.perf_counter() < deadline:
+        scenario = workload.rng.choices(names, weights)[0]
+        method, path, body = workload.build(scenario)
+
+        started = time.perf_counter()
+        try:
+            status, _ = await client.request(method, path, body)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            status = 0
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        if started < measure_from:
+            continue
+        entry = results[scenario]
+        entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+        # 4xx(하루 이용 제한, 동명이인 등)는 정상 흐름이므로 지연 시간에 포함
+        if status == 0 or status >= 500:
+            entry["errors"] += 1
+        else:
+            entry["latencies"].append(latency_ms)
+
+
+def parse_mix(value: str | None) -> list[tuple[str, int]]:
+    if not value:
+        return [(name, weight) for name, (_, _, weight) in SCENARIOS.items()]
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name} ({', '.join(SCENARIOS)})")
+        mix.append((name, int(weight or 1)))
+    return mix
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    started_at = datetime.now(timezone.utc).isoformat()
+    rng = random.Random(args.seed)
+    workload = await Workload.load(rng, args.sample_members)
+    mix = args.mix
+
+    results = {name: {"statuses": {}, "errors": 0, "latencies": []} for name, _ in mix}
+    clients = [HttpClient(args.base_url) for _ in range(args.concurrency)]
+
+    now = time.perf_counter()
+    measure_from = now + args.warmup
+    deadline = measure_from + args.duration
+    tasks = [
+        asyncio.create_task(worker(client, workload, mix, deadline, measure_from, results))
+        for client in clients
+    ]
+
+    # 워밍업이 끝난 시점의 지표를 기준으로 측정 구간의 쿼리 수를 계산
+    await asyncio.sleep(args.warmup)
+    metrics_before = await scrape_db_metrics(args.base_url)
+    await asyncio.gather(*tasks)
+    metrics_after = await scrape_db_metrics(args.base_url)
+    for client in clients:
+        await client.close()
+
+    endpoints = {}
+    all_latencies = []
+    for name, _ in mix:
+        method, route, _ = SCENARIOS[name]
+        entry = results[name]
+        all_latencies.extend(entry["latencies"])
+        endpoints[name] = {
+            "method": method,
+            "route": route,
+            **summarize(entry["latencies"], args.duration),
+            "errors": entry["errors"],
+            "statuses": entry["statuses"],
+            **db_usage(metrics_before, metrics_after, method, route),
+        }
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": started_at,
+            "base_url": args.base_url,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "mix": dict(mix),
+        },
+        "total": {
+            **summarize(all_latencies, args.duration),
+            "errors": sum(r["errors"] for r in results.values()),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키오스크 흐름 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정에서 제외할 시작 구간 (초)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 요청하는 키오스크 수")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(None),
+                        help="시나리오 비중, 예: log-in=30,check-in=30,board=5")
+    parser.add_argument("--sample-members", type=int, default=5000, help="요청에 사용할 회원 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로 (없으면 표준 출력)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"결과 저장: {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""벤치마크용 로컬 Postgres 데이터 적재
+
+    PYTHONPATH=src python -m bench.seed --members 100000 --truncate
+
+데이터 모양(동명이인, 1년치 방문 기록, 인기 시설 쏠림)은 database/synthetic.py 를 따르며
+같은 --seed 면 같은 데이터가 만들어진다. 테이블은 --create-tables 로 만들 수 있다 (마이그레이션 인덱스 포함).
+"""
+import asyncio
+
+from database.synthetic import build_parser, dataset_from_args, run
+
+
+def main():
+    parser = build_parser("벤치마크용 데이터 적재")
+    args = parser.parse_args()
+    try:
+        dataset_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
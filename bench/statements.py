@@ -0,0 +1,106 @@
+"""자주 실행되는 조회 쿼리의 호출당 준비 비용 비교 (DB 불필요)
+
+    PYTHONPATH=src python -m bench.statements --iterations 20000
+
+- build: 예전처럼 호출마다 select() 를 만들고 캐시 키 계산
+- precompiled: database/statements.py 의 문장 재사용 (캐시 키가 메모됨)
+- execute: 두 방식으로 인메모리 SQLite 에서 실제로 실행 (컴파일 캐시 조회, 파라미터 처리 포함)
+"""
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from database import statements
+from database.orm import Base, User, MemberVisit, FacilityStatus, ReservationUser
+
+NAME, BIRTH, PHONE, MEMBER_ID = "김영숙", date(1950, 3, 1), "01012345678", "000001"
+
+
+def _built_queries():
+    """예전 레포지토리 코드와 같은 방식으로 호출마다 새로 만드는 문장"""
+    return {
+        "user by name/birth": lambda: (
+            select(User).where(User.name == NAME, User.birth == BIRTH), None
+        ),
+        "user by phone": lambda: (
+            select(User).where(User.phone_num == PHONE), None
+        ),
+        "visit today": lambda: (
+            select(MemberVisit.id)
+            .where(MemberVisit.user_id == MEMBER_ID)
+            .where(statements.visited_today())
+            .limit(1), None
+        ),
+        "visitors today": lambda: (
+            select(MemberVisit.user_id)
+            .where(MemberVisit.user_id.in_([MEMBER_ID, "000002", "000003"]))
+            .where(statements.visited_today())
+            .distinct(), None
+        ),
+        "facility status": lambda: (
+            select(FacilityStatus.status).where(FacilityStatus.facility_id == 1), None
+        ),
+        "reservation users": lambda: (
+            select(User.member_id, User.name)
+            .join(ReservationUser, ReservationUser.user_id == User.member_id)
+            .where(ReservationUser.reservation_id == 1), None
+        ),
+    }
+
+
+def _precompiled_queries():
+    return {
+        "user by name/birth": lambda: (statements.USER_BY_NAME_AND_BIRTH, {"name": NAME, "birth": BIRTH}),
+        "user by phone": lambda: (statements.USER_BY_PHONE_NUM, {"phone_num": PHONE}),
+        "visit today": lambda: (statements.VISIT_TODAY, {"member_id": MEMBER_ID}),
+        "visitors today": lambda: (
+            statements.VISITORS_TODAY, {"member_ids": [MEMBER_ID, "000002", "000003"]}
+        ),
+        "facility status": lambda: (statements.FACILITY_STATUS, {"facility_id": 1}),
+        "reservation users": lambda: (statements.RESERVATION_USERS, {"reservation_id": 1}),
+    }
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    fn()  # 컴파일 캐시 채우기
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미리 만들어 둔 조회 문장과 호출마다 만드는 문장 비교")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    built, precompiled = _built_queries(), _precompiled_queries()
+
+    print(f"{'query':<20} {'build':>10} {'precomp.':>10} {'exec(build)':>12} {'exec(precomp.)':>15}  (us/call)")
+    with Session(engine) as session:
+        for name in built:
+            def prepare(factory):
+                return lambda: factory()[0]._generate_cache_key()
+
+            def execute(factory):
+                def run():
+                    stmt, params = factory()
+                    session.execute(stmt, params).all()
+                return run
+
+            row = [
+                _per_call_us(prepare(built[name]), args.iterations),
+                _per_call_us(prepare(precompiled[name]), args.iterations),
+                _per_call_us(execute(built[name]), args.iterations // 4),
+                _per_call_us(execute(precompiled[name]), args.iterations // 4),
+            ]
+            print(f"{name:<20} {row[0]:>10.1f} {row[1]:>10.1f} {row[2]:>12.1f} {row[3]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
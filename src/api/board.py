@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, UploadFile, Form
+from fastapi import APIRouter, Depends, UploadFile, Form, Query
 from service.board_service import BoardService
+from core.config import settings
 from core.di import get_board_service
 
 router = APIRouter(prefix="/board", tags=["Board"])
@@ -22,9 +23,11 @@ async def get_board(
 
 @router.get("", status_code=200)
 async def get_all_boards(
+    cursor: str | None = None,
+    size: int = Query(settings.BOARD_PAGE_SIZE, ge=1, le=settings.BOARD_MAX_PAGE_SIZE),
     board_service: BoardService = Depends(get_board_service)
 ):
-    return await board_service.get_all_boards()
+    return await board_service.get_all_boards(size=size, cursor=cursor)
 
 @router.patch("/{board_id}", status_code=200)
 async def update_board(
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
-from core.di import get_facility_service
+from core.di import get_facility_service, get_facility_event_service
 from schema.request import FacilityReservationRequest, FacilityReservationConfirmRequest, \
     FacilityMultiReservationRequest, FacilityMultiReservationConfirmRequest
+from service.facility_event_service import FacilityEventService
 from service.facility_service import FacilityService
 
 router = APIRouter(prefix="/facility", tags=["Facility"])
@@ -21,6 +23,19 @@ async def facility_reservation_confirm(
 ):
     return await facility_service.reserve_confirm(request)
 
+# /{facility_id} 보다 먼저 등록해야 함
+@router.get("/events", status_code=200)
+async def facility_events(
+    facility_id: int | None = None,
+    event_service: FacilityEventService = Depends(get_facility_event_service)
+):
+    events = await event_service.stream(facility_id)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/{facility_id}", status_code=200)
 async def get_reservations_by_facility(
     facility_id: int,
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from util.metrics import registry
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    # Prometheus 수집용 (워커별 값)
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
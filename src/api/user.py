@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, Request, Query
+from fastapi import APIRouter, Depends, Request, Query, UploadFile, File
 from datetime import date
+from typing import Literal
 
-from schema.request import SignUpRequest, LogInRequest, ConfirmPhoneRequest
+from core.config import settings
+from schema.request import SignUpRequest, LogInRequest, ConfirmPhoneRequest, CheckInSyncRequest
 from service.user_service import UserService
 from core.di import get_user_service
 
@@ -14,6 +16,13 @@ async def user_sign_up(
 ):
     return await user_service.sign_up(request)
 
+@router.post("/import", status_code=200)
+async def import_users(
+        file: UploadFile = File(..., description="CSV(member_id,name,gender,birth,phone_num 헤더) 또는 JSONL"),
+        user_service: UserService = Depends(get_user_service),
+):
+    return await user_service.import_users(file)
+
 @router.post("/log-in", status_code=200)
 async def user_log_in(
         request: LogInRequest,
@@ -37,6 +46,14 @@ async def user_log_in(
 ):
     return await user_service.check_in(request, req)
 
+@router.post("/check-in/sync", status_code=200)
+async def sync_check_ins(
+        request: CheckInSyncRequest,
+        user_service: UserService = Depends(get_user_service),
+):
+    # 키오스크 네트워크 장애 중 쌓인 방문 기록 일괄 전송
+    return await user_service.sync_check_ins(request)
+
 
 @router.get("/search", status_code=200)
 async def search_users(
@@ -46,11 +63,33 @@ async def search_users(
 ):
     return await user_service.find_users_with_name_and_birth(name, birth)
 
+@router.get("/autocomplete", status_code=200)
+async def autocomplete_names(
+        q: str = Query(..., min_length=1, max_length=20),
+        limit: int = Query(10, ge=1, le=50),
+        user_service: UserService = Depends(get_user_service)
+):
+    return user_service.autocomplete_names(q, limit=limit)
+
+@router.get("/name-search", status_code=200)
+async def search_users_by_name(
+        q: str = Query(..., min_length=1, max_length=20),
+        mode: Literal["auto", "prefix", "contains"] = "auto",
+        limit: int = Query(20, ge=1, le=settings.USER_MAX_PAGE_SIZE),
+        user_service: UserService = Depends(get_user_service)
+):
+    return await user_service.search_users_by_name(q, limit=limit, mode=mode)
+
 @router.get("", status_code=200)
 async def get_all_users(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1),
+    cursor: str | None = None,
+    limit: int = Query(settings.USER_PAGE_SIZE, ge=1, le=settings.USER_MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0, deprecated=True, description="OFFSET 방식 (deprecated, cursor 사용)"),
     name: str | None = None,
     user_service: UserService = Depends(get_user_service)
 ):
-    return await user_service.get_all_users(skip=skip, limit=limit, name=name)
\ No newline at end of file
+    # cursor 를 넘기지 않은 기존 클라이언트는 이전과 같은 목록 형태로 응답
+    # 키셋 페이지({"items", "next_cursor"})는 첫 페이지를 cursor= (빈 값)으로 요청
+    if cursor is None:
+        return await user_service.get_all_users(skip=skip, limit=limit, name=name)
+    return await user_service.get_users_page(limit=limit, cursor=cursor, name=name)
@@ -0,0 +1,35 @@
+class FacilityStatusCache:
+    """facility_id → status 전체 캐시
+
+    LISTEN 커넥션이 살아 있을 때만 사용(active)한다.
+    상태가 바뀌면 NOTIFY 로 모든 워커의 캐시가 비워지고, 다음 조회 때 한 번에 다시 채운다.
+    """
+
+    def __init__(self):
+        self._statuses: dict[int, str] | None = None
+        self._version = 0
+        self.active = False
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get_all(self) -> dict[int, str] | None:
+        return self._statuses
+
+    def set_all(self, statuses: dict[int, str], version: int):
+        # 조회하는 사이에 무효화됐다면 오래된 값이므로 버림
+        if version == self._version:
+            self._statuses = statuses
+
+    def invalidate(self):
+        self._version += 1
+        self._statuses = None
+
+    def set_active(self, active: bool):
+        # 재접속 전후로 놓친 알림이 있을 수 있으므로 항상 비움
+        self.invalidate()
+        self.active = active
+
+
+facility_status_cache = FacilityStatusCache()
@@ -0,0 +1,37 @@
+import time
+from collections import OrderedDict
+
+from core.config import settings
+
+
+class IdempotencyCache:
+    """Idempotency-Key → 첫 응답, 크기 제한이 있는 TTL 캐시
+
+    DB(idempotency_record)에 저장된 응답을 워커 안에서 다시 조회하지 않도록 앞에 둔다.
+    가득 차면 가장 오래 쓰지 않은 키부터 버린다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict, ttl: float | None = None):
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+idempotency_cache = IdempotencyCache(settings.IDEMPOTENCY_CACHE_SIZE, settings.IDEMPOTENCY_TTL_SECONDS)
@@ -0,0 +1,79 @@
+from datetime import date
+
+
+class MemberIndex:
+    """(이름, 생년월일) → 회원 목록 인메모리 인덱스
+
+    서버 시작 시 한 번 적재하고, 회원가입/일괄 등록 시 갱신한다.
+    다른 워커에서 가입한 회원은 NOTIFY(MEMBER_CHANNEL)로 전달받아 추가하므로,
+    이미 한 명이 있는 (이름, 생년월일)에 동명이인이 가입해도 바로 반영된다.
+    LISTEN 커넥션이 끊겨 있으면 알림을 놓칠 수 있으므로 사용하지 않고(active), 재접속 후 다시 적재한다.
+    적재용 조회가 LISTEN 연결 중에 시작돼 끝날 때까지 끊기지 않았을 때만 적재된 것(loaded)으로 본다.
+    """
+
+    def __init__(self):
+        self._members: dict[tuple[str, date], list[dict]] = {}
+        self._pending: list[tuple] | None = None
+        # LISTEN 연결마다 증가 (적재 중 재접속했는지 확인용)
+        self._connection_no = 0
+        self._load_connection_no: int | None = None
+        self.loaded = False
+        self.active = False
+
+    @property
+    def usable(self) -> bool:
+        return self.loaded and self.active
+
+    def set_active(self, active: bool):
+        # 끊겨 있는 동안의 가입은 반영되지 않았으므로 다시 적재할 때까지 사용하지 않음
+        if not active:
+            self.loaded = False
+        elif not self.active:
+            self._connection_no += 1
+        self.active = active
+
+    def begin_load(self):
+        """적재용 조회 직전에 호출 (조회와 load 사이에 들어온 가입도 놓치지 않도록 모아 둠)"""
+        self._pending = []
+        self._load_connection_no = self._connection_no if self.active else None
+
+    def load(self, rows):
+        """(member_id, name, birth, phone_num) 행 목록으로 인덱스 전체 교체"""
+        members: dict[tuple[str, date], list[dict]] = {}
+        for member_id, name, birth, phone_num in rows:
+            members.setdefault((name, birth), []).append({
+                "member_id": member_id,
+                "name": name,
+                "birth": birth,
+                "phone": phone_num
+            })
+        pending, self._pending = self._pending or [], None
+        self._members = members
+        for args in pending:
+            self.add(*args)
+        # 조회 전에 LISTEN 이 없었거나 조회 중 끊겼다면 그 사이 가입을 놓쳤을 수 있음
+        self.loaded = self.active and self._load_connection_no == self._connection_no
+
+    def add(self, member_id: str, name: str, birth: date, phone: str):
+        if self._pending is not None:
+            self._pending.append((member_id, name, birth, phone))
+        entries = self._members.setdefault((name, birth), [])
+        if any(e["member_id"] == member_id for e in entries):
+            return
+        entries.append({
+            "member_id": member_id,
+            "name": name,
+            "birth": birth,
+            "phone": phone
+        })
+
+    def on_member_added(self, payload: dict):
+        """MEMBER_CHANNEL 알림 처리 (다른 워커에서 가입/등록된 회원)"""
+        self.add(payload["member_id"], payload["name"], date.fromisoformat(payload["birth"]), payload["phone"])
+
+    def get(self, name: str, birth: date) -> list[dict]:
+        # 호출 측에서 수정해도 인덱스가 바뀌지 않도록 복사본 반환
+        return [dict(e) for e in self._members.get((name, birth), [])]
+
+
+member_index = MemberIndex()
@@ -0,0 +1,124 @@
+from collections import deque
+from datetime import date
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+            "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 키보드로 두 번에 나눠 입력하는 겹모음/겹받침은 입력 순서대로 분해 (입력 중인 '고' 가 '과' 의 접두어가 되도록)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def decompose(text: str) -> str:
+    """'김미' → 'ㄱㅣㅁㅁㅣ' (한글 외 문자는 그대로)"""
+    jamo = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            idx = code - HANGUL_BASE
+            parts = (CHOSUNG[idx // 588], JUNGSUNG[(idx % 588) // 28], JONGSUNG[idx % 28])
+        else:
+            parts = (ch,)
+        for part in parts:
+            jamo.append(COMPOUND_JAMO.get(part, part))
+    return "".join(jamo)
+
+
+def chosung(text: str) -> str:
+    """'김미숙' → 'ㄱㅁㅅ'"""
+    initials = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            initials.append(CHOSUNG[(code - HANGUL_BASE) // 588])
+        else:
+            initials.append(ch)
+    return "".join(initials)
+
+
+def is_chosung_only(text: str) -> bool:
+    return all(ch in CHOSUNG for ch in text)
+
+
+class _Node:
+    __slots__ = ("children", "member_ids")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.member_ids: list[str] = []
+
+
+class NameTrie:
+    """키오스크 이름 자동완성용 트라이
+
+    자모 트라이('김ㅁ', '김미')와 초성 트라이('ㄱㅁㅅ') 두 개를 유지한다.
+    서버 시작 시 전체 회원으로 만들고, 회원가입 시 한 명씩 추가한다.
+    """
+
+    def __init__(self):
+        self._jamo_root = _Node()
+        self._chosung_root = _Node()
+        self._members: dict[str, dict] = {}
+        self.loaded = False
+
+    @staticmethod
+    def _insert(root: _Node, key: str, member_id: str):
+        node = root
+        for ch in key:
+            node = node.children.setdefault(ch, _Node())
+        node.member_ids.append(member_id)
+
+    def load(self, rows):
+        """(member_id, name, birth, ...) 행 목록으로 트라이 전체 교체"""
+        jamo_root, chosung_root, members = _Node(), _Node(), {}
+        for member_id, name, birth, *_ in rows:
+            members[member_id] = {"member_id": member_id, "name": name, "birth": birth}
+            self._insert(jamo_root, decompose(name), member_id)
+            self._insert(chosung_root, chosung(name), member_id)
+        self._jamo_root, self._chosung_root, self._members = jamo_root, chosung_root, members
+        self.loaded = True
+
+    def add(self, member_id: str, name: str, birth: date):
+        if member_id in self._members:
+            return
+        self._members[member_id] = {"member_id": member_id, "name": name, "birth": birth}
+        self._insert(self._jamo_root, decompose(name), member_id)
+        self._insert(self._chosung_root, chosung(name), member_id)
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        query = "".join(query.split())
+        if not query:
+            return []
+
+        if is_chosung_only(query):
+            node, key = self._chosung_root, query
+        else:
+            node, key = self._jamo_root, decompose(query)
+
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+
+        # 너비 우선 탐색이라 짧은 이름(입력과 가장 가까운 이름)이 먼저 나옴
+        results = []
+        queue = deque([node])
+        while queue and len(results) < limit:
+            current = queue.popleft()
+            for member_id in current.member_ids:
+                results.append(dict(self._members[member_id]))
+                if len(results) >= limit:
+                    break
+            queue.extend(current.children.values())
+        return results
+
+
+name_trie = NameTrie()
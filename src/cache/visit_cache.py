@@ -0,0 +1,42 @@
+from datetime import date
+
+
+class TodayVisitCache:
+    """오늘 방문한 member_id 집합
+
+    방문 기록이 확인된 회원만 담는다 (없다는 사실은 캐시하지 않음).
+    로컬 자정이 지나면 다음 접근 시 비워진다.
+    """
+
+    def __init__(self):
+        self._day = date.today()
+        self._member_ids: set[str] = set()
+
+    def _rollover(self):
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._member_ids = set()
+
+    def load(self, member_ids):
+        self._day = date.today()
+        self._member_ids = set(member_ids)
+
+    def add(self, member_id: str):
+        self._rollover()
+        self._member_ids.add(member_id)
+
+    def add_all(self, member_ids):
+        self._rollover()
+        self._member_ids.update(member_ids)
+
+    def contains(self, member_id: str) -> bool:
+        self._rollover()
+        return member_id in self._member_ids
+
+    def contains_any(self, member_ids) -> bool:
+        self._rollover()
+        return any(m in self._member_ids for m in member_ids)
+
+
+today_visit_cache = TodayVisitCache()
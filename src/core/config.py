@@ -17,9 +17,55 @@ class Settings(BaseSettings):
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: SecretStr
     AWS_BUCKET_NAME: str
+    S3_MAX_WORKERS: int = 16  # 워커당 S3 I/O 스레드 수
+    S3_UPLOAD_CONCURRENCY: int = 4  # 게시글 하나의 이미지 동시 업로드 수
+    # 페이지네이션
+    BOARD_PAGE_SIZE: int = 20
+    BOARD_MAX_PAGE_SIZE: int = 100
+    USER_PAGE_SIZE: int = 100
+    USER_MAX_PAGE_SIZE: int = 500
+
+    # 회원 일괄 등록 (POST /users/import) 최대 행 수
+    USER_IMPORT_MAX_ROWS: int = 20000
+    # 키오스크 오프라인 방문 동기화 (POST /users/check-in/sync) 한 번에 보낼 수 있는 건수
+    CHECK_IN_SYNC_MAX_ITEMS: int = 1000
+
+    # DB 커넥션 풀 (워커마다 따로 생성됨: 최대 커넥션 = 워커 수 * (POOL_SIZE + MAX_OVERFLOW))
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = -1  # 이 시간(초)이 지난 커넥션은 새로 연결, -1 이면 사용 안 함
+    DB_POOL_PRE_PING: bool = False  # 꺼내기 전에 커넥션이 살아있는지 확인
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statement 캐시 크기
+    # PgBouncer(transaction 모드) 뒤에서 실행할 때 prepared statement 캐시 비활성화
+    DB_PGBOUNCER_MODE: bool = False
+
+    # 개발/스테이징용 요청별 쿼리 수 검사 (N+1 의심 쿼리 출력)
+    QUERY_BUDGET_ENABLED: bool = False
+    QUERY_BUDGET: int = 20  # 요청 하나의 최대 쿼리 수
+    QUERY_REPEAT_THRESHOLD: int = 3  # 같은 쿼리가 이 횟수 이상 반복되면 출력
+    QUERY_BUDGET_RAISE: bool = False  # 예산을 넘으면 출력 대신 예외로 요청 실패
+
     # 공통
     ENV: Literal["dev", "prod", "test"] = "dev"
 
+    # 인메모리 캐시 (워커마다 따로 유지됨)
+    # 회원 인덱스는 LISTEN/NOTIFY 로 다른 워커의 가입을 반영하며, LISTEN 커넥션이 끊긴 동안은 DB 조회
+    MEMBER_INDEX_ENABLED: bool = False
+    NAME_AUTOCOMPLETE_ENABLED: bool = False
+    VISIT_CACHE_ENABLED: bool = False
+    # LISTEN/NOTIFY 로 워커 간 무효화
+    FACILITY_STATUS_CACHE_ENABLED: bool = False
+    # 시설 상태/예약 SSE 스트림 (/facility/events)
+    FACILITY_EVENTS_ENABLED: bool = False
+
+    # Idempotency-Key 헤더로 POST 재시도 중복 처리 방지 (idempotency_record 테이블 필요)
+    IDEMPOTENCY_ENABLED: bool = False
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # 첫 응답을 보관하는 시간
+    # 처리 중인 선점의 만료 시간 (처리 중에는 절반마다 연장되므로, 워커가 죽었을 때 키를 다시 쓸 수 있기까지)
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_CACHE_SIZE: int = 10000  # 워커별 인메모리 응답 캐시 최대 개수
+
     class Config:
         env_file = str(ENV_PATH)
         case_sensitive = True
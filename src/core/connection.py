@@ -1,15 +1,86 @@
+import time
+from uuid import uuid4
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
+from util.metrics import registry
+from util.query_budget import install_query_log
+from util.timer import instrument_engine
+
+POOL_CHECKOUT_SECONDS = registry.histogram(
+    "db_pool_checkout_seconds",
+    "커넥션 풀에서 커넥션을 받기까지 걸린 시간 (대기 + 새 커넥션 생성/pre-ping)",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "DB_POOL_TIMEOUT 안에 커넥션을 받지 못한 횟수"
+)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 받기까지 걸린 시간을 기록하는 풀 (풀 크기를 정할 근거)"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
+def _connect_args() -> dict:
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer transaction 모드에서는 커넥션이 바뀌므로 prepared statement 를 재사용할 수 없음
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+
 POSTGRES_DATABASE_URL = settings.POSTGRES_DATABASE_URL
-postgres_engine = create_async_engine(POSTGRES_DATABASE_URL)
+postgres_engine = create_async_engine(
+    POSTGRES_DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args()
+)
+# 쿼리 수/DB 시간을 요청별로 집계 (/metrics)
+instrument_engine(postgres_engine)
+# 쿼리 수 검사 (QUERY_BUDGET_ENABLED 또는 테스트에서 기록 중일 때만 동작)
+install_query_log(postgres_engine)
 AsyncSessionLocal = sessionmaker(
     bind=postgres_engine,
     expire_on_commit=False,
     class_=AsyncSession
 )
 
+registry.gauge("db_pool_size", "커넥션 풀 크기 (DB_POOL_SIZE)", lambda: postgres_engine.pool.size())
+registry.gauge("db_pool_checked_out", "사용 중인 커넥션 수", lambda: postgres_engine.pool.checkedout())
+registry.gauge("db_pool_overflow", "pool_size 를 넘어 추가로 연 커넥션 수", lambda: max(postgres_engine.pool.overflow(), 0))
+
 async def get_postgres_db():
+    """요청 단위 세션
+
+    - 세션을 만들 때는 커넥션을 잡지 않고, 첫 쿼리에서 풀로부터 받는다 (검증 실패 등으로 쿼리가 없으면 받지 않음)
+    - 커밋하면 바로 풀에 반납하고, 읽기만 한 경우에는 응답 직렬화 직후 세션을 닫으며 반납한다
+    - 한 요청 안의 모든 리포지토리가 같은 세션을 공유한다 (FastAPI 의존성 캐시)
+    """
     async with AsyncSessionLocal() as session:
         yield session
@@ -1,41 +1,73 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache.facility_status_cache import FacilityStatusCache, facility_status_cache
+from cache.member_index import MemberIndex, member_index
+from cache.name_trie import NameTrie, name_trie
+from cache.visit_cache import today_visit_cache
+from core.config import settings
 from core.connection import get_postgres_db
+from core.storage import S3Storage
 from database.repository.board_repository import BoardRepository
 from database.repository.facility_repository import FacilityRepository
 from database.repository.visit_repository import MemberVisitRepository
 from service.board_service import BoardService
+from service.facility_event_service import FacilityEventService, facility_event_service
 from service.facility_service import FacilityService
 from service.user_service import UserService
 from database.repository.user_repository import UserRepository
 
 # ------------------- 리포지토리 관련 DI -------------------
+# 모든 리포지토리가 Depends(get_postgres_db) 를 쓰므로 요청당 세션(커넥션)은 하나만 사용됨
+# (get_facility_service 처럼 여러 리포지토리를 거쳐도 마찬가지, use_cache=False 로 바꾸지 말 것)
 def get_user_repo(session: AsyncSession = Depends(get_postgres_db)) -> UserRepository:
     return UserRepository(session)
 
 def get_visit_repo(session: AsyncSession = Depends(get_postgres_db)) -> MemberVisitRepository:  # ✅ 추가
-    return MemberVisitRepository(session)
+    visit_cache = today_visit_cache if settings.VISIT_CACHE_ENABLED else None
+    return MemberVisitRepository(session, visit_cache)
 
 def get_board_repo(session: AsyncSession = Depends(get_postgres_db)) -> BoardRepository:
     return BoardRepository(session)
+# ------------------- 캐시 관련 DI -------------------
+def get_member_index() -> MemberIndex | None:
+    return member_index if settings.MEMBER_INDEX_ENABLED else None
+
+def get_name_trie() -> NameTrie | None:
+    return name_trie if settings.NAME_AUTOCOMPLETE_ENABLED else None
+
+def get_facility_status_cache() -> FacilityStatusCache | None:
+    return facility_status_cache if settings.FACILITY_STATUS_CACHE_ENABLED else None
+
 # ------------------- 서비스 관련 DI -------------------
 def get_user_service(
     user_repo: UserRepository = Depends(get_user_repo),
-    visit_repo: MemberVisitRepository = Depends(get_visit_repo)  # ✅ 추가
+    visit_repo: MemberVisitRepository = Depends(get_visit_repo),  # ✅ 추가
+    member_index: MemberIndex | None = Depends(get_member_index),
+    name_trie: NameTrie | None = Depends(get_name_trie)
 ) -> UserService:
-    return UserService(user_repo, visit_repo)  # ✅ visit_repo 주입
+    return UserService(user_repo, visit_repo, member_index, name_trie)  # ✅ visit_repo 주입
 
 def get_facility_repo(session: AsyncSession = Depends(get_postgres_db)) -> FacilityRepository:
     return FacilityRepository(session)
 
 def get_facility_service(
     facility_repo: FacilityRepository = Depends(get_facility_repo),
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_user_service),
+    status_cache: FacilityStatusCache | None = Depends(get_facility_status_cache)
 ) -> FacilityService:
-    return FacilityService(facility_repo, user_service)
+    return FacilityService(facility_repo, user_service, status_cache)
+
+def get_facility_event_service() -> FacilityEventService:
+    # DB 세션을 잡지 않음 (스트림이 열려 있는 동안 커넥션을 점유하지 않도록)
+    return facility_event_service
+
+def get_storage(request: Request) -> S3Storage:
+    # lifespan 에서 만든 공유 클라이언트
+    return request.app.state.storage
 
 def get_board_service(
-    board_repo: BoardRepository = Depends(get_board_repo)
+    board_repo: BoardRepository = Depends(get_board_repo),
+    storage: S3Storage = Depends(get_storage)
 ) -> BoardService:
-    return BoardService(board_repo)
+    return BoardService(board_repo, storage)
@@ -0,0 +1,204 @@
+import asyncio
+import hashlib
+
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from cache.idempotency_cache import IdempotencyCache, idempotency_cache
+from core.config import settings
+from core.connection import AsyncSessionLocal
+from database.repository.idempotency_repository import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = "idempotent-replayed"
+# api/user.py, api/facility.py, api/board.py 의 POST
+IDEMPOTENT_PATH_PREFIXES = ("/users", "/facility", "/board")
+MAX_KEY_LENGTH = 255
+
+
+def _request_hash(scope: Scope, key: str, body: bytes | None) -> str:
+    """같은 요청인지 비교할 해시 (method + path + query + 본문)
+
+    multipart 본문은 재전송할 때마다 boundary 가 새로 만들어지므로 본문 대신 키를 넣는다 (body=None).
+    """
+    parts = [scope["method"].encode(), scope["path"].encode(), scope["query_string"]]
+    parts.append(key.encode() if body is None else body)
+    return hashlib.sha256(b"\n".join(parts)).hexdigest()
+
+
+def _is_multipart(scope: Scope) -> bool:
+    content_type = dict(scope["headers"]).get(b"content-type", b"")
+    return content_type.lower().startswith(b"multipart/form-data")
+
+
+def _error(status_code: int, code: str, message: str) -> Response:
+    # HTTPException 과 같은 응답 형태
+    return JSONResponse(status_code=status_code, content={"detail": {"code": code, "message": message}})
+
+
+class IdempotencyMiddleware:
+    """Idempotency-Key 헤더가 붙은 POST 요청의 첫 응답을 저장해 재시도에 그대로 돌려줌
+
+    키오스크 더블탭/재전송으로 같은 요청이 다시 와도 서비스 로직을 다시 실행하지 않는다.
+    - 워커 안에서는 인메모리 TTL 캐시, 워커 간에는 idempotency_record 테이블로 공유
+    - 같은 키가 처리 중이면 409, 다른 요청 내용에 같은 키를 쓰면 422
+    - 5xx 응답은 저장하지 않고 선점을 풀어 재시도 시 다시 처리
+    - 처리 중에는 선점 만료 시간을 계속 연장 (IDEMPOTENCY_LOCK_SECONDS 보다 오래 걸리는 대용량 등록 등)
+    """
+
+    def __init__(self, app: ASGIApp, cache: IdempotencyCache = idempotency_cache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(IDEMPOTENT_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = dict(scope["headers"]).get(IDEMPOTENCY_HEADER)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = key.decode("latin-1").strip()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await _error(400, "INVALID_IDEMPOTENCY_KEY", f"Idempotency-Key 는 1~{MAX_KEY_LENGTH}자입니다")(
+                scope, receive, send
+            )
+            return
+
+        if _is_multipart(scope):
+            # 파일 업로드(/board, /users/import)는 본문을 버퍼링하지 않음
+            request_hash = _request_hash(scope, key, None)
+        else:
+            body, receive = await self._buffer_body(receive)
+            request_hash = _request_hash(scope, key, body)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            await self._replay(cached, request_hash, scope, receive, send)
+            return
+
+        try:
+            async with AsyncSessionLocal() as session:
+                claimed, record = await IdempotencyRepository(session).claim(
+                    key, request_hash, settings.IDEMPOTENCY_LOCK_SECONDS
+                )
+        except Exception as e:
+            # 저장소 장애 시에는 중복 방지 없이 그대로 처리
+            print(f"Idempotency-Key 선점 실패: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        if not claimed:
+            if record is None or record.status_code is None:
+                await _error(409, "IDEMPOTENCY_KEY_IN_USE", "같은 요청을 처리 중입니다. 잠시 후 다시 시도해 주세요")(
+                    scope, receive, send
+                )
+                return
+            stored = {
+                "request_hash": record.request_hash,
+                "status_code": record.status_code,
+                "headers": record.headers,
+                "body": record.body,
+            }
+            self.cache.set(key, stored)
+            await self._replay(stored, request_hash, scope, receive, send)
+            return
+
+        await self._run_and_store(key, request_hash, scope, receive, send)
+
+    @staticmethod
+    async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+        """요청 본문을 모두 읽고, 같은 본문을 다시 넘겨주는 receive 반환"""
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay_receive
+
+    async def _replay(self, stored: dict, request_hash: str, scope: Scope, receive: Receive, send: Send):
+        if stored["request_hash"] != request_hash:
+            await _error(422, "IDEMPOTENCY_KEY_MISMATCH", "다른 요청에 이미 사용된 Idempotency-Key 입니다")(
+                scope, receive, send
+            )
+            return
+
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in stored["headers"]]
+        headers.append((REPLAYED_HEADER.encode(), b"true"))
+        await send({"type": "http.response.start", "status": stored["status_code"], "headers": headers})
+        await send({"type": "http.response.body", "body": stored["body"]})
+
+    async def _run_and_store(self, key: str, request_hash: str, scope: Scope, receive: Receive, send: Send):
+        status_code = 500
+        headers = []
+        chunks = []
+
+        async def capture_send(message: Message):
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        keep_claim = asyncio.create_task(self._keep_claim(key))
+        try:
+            await self.app(scope, receive, capture_send)
+        finally:
+            keep_claim.cancel()
+            await self._finish(key, request_hash, status_code, headers, b"".join(chunks))
+
+    @staticmethod
+    async def _keep_claim(key: str):
+        """처리가 끝날 때까지 선점 만료 시간 연장 (워커가 죽으면 연장이 멈춰 LOCK_SECONDS 뒤 다시 선점 가능)"""
+        interval = settings.IDEMPOTENCY_LOCK_SECONDS / 2
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with AsyncSessionLocal() as session:
+                    await IdempotencyRepository(session).extend_claim(key, settings.IDEMPOTENCY_LOCK_SECONDS)
+            except Exception as e:
+                print(f"Idempotency-Key 선점 연장 실패: {e}")
+
+    async def _finish(self, key: str, request_hash: str, status_code: int, headers: list, body: bytes):
+        try:
+            async with AsyncSessionLocal() as session:
+                repo = IdempotencyRepository(session)
+                if status_code >= 500:
+                    await repo.release(key)
+                    return
+                await repo.complete(key, status_code, headers, body, settings.IDEMPOTENCY_TTL_SECONDS)
+        except Exception as e:
+            print(f"Idempotency-Key 응답 저장 실패: {e}")
+            return
+
+        self.cache.set(key, {
+            "request_hash": request_hash,
+            "status_code": status_code,
+            "headers": headers,
+            "body": body,
+        })
@@ -0,0 +1,112 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+
+from fastapi import FastAPI
+
+from cache.facility_status_cache import facility_status_cache
+from cache.member_index import member_index
+from cache.name_trie import name_trie
+from cache.visit_cache import today_visit_cache
+from core.config import settings
+from core.connection import AsyncSessionLocal
+from core.pubsub import pg_listener, FACILITY_STATUS_CHANNEL, FACILITY_RESERVATION_CHANNEL, MEMBER_CHANNEL
+from core.storage import create_s3_storage
+from database.repository.idempotency_repository import IdempotencyRepository
+from database.repository.user_repository import UserRepository
+from database.repository.visit_repository import MemberVisitRepository
+from service.facility_event_service import facility_event_service
+
+# 시작 시 적재와 재접속 후 재적재가 겹치지 않도록
+_member_lookups_lock = asyncio.Lock()
+
+
+async def load_member_lookups():
+    """회원 인덱스/이름 자동완성 트라이를 한 번의 조회로 적재"""
+    if settings.MEMBER_INDEX_ENABLED:
+        member_index.begin_load()
+    async with AsyncSessionLocal() as session:
+        rows = await UserRepository(session).get_member_lookup_rows()
+    if settings.MEMBER_INDEX_ENABLED:
+        member_index.load(rows)
+    if settings.NAME_AUTOCOMPLETE_ENABLED:
+        name_trie.load(rows)
+    print(f"회원 인덱스 적재 완료: {len(rows)}명")
+
+
+def on_member_added(payload: dict):
+    # 다른 워커에서 가입/일괄 등록된 회원 (자기 워커의 알림도 오지만 add 는 중복을 무시함)
+    if settings.MEMBER_INDEX_ENABLED:
+        member_index.on_member_added(payload)
+    if settings.NAME_AUTOCOMPLETE_ENABLED:
+        name_trie.add(payload["member_id"], payload["name"], date.fromisoformat(payload["birth"]))
+
+
+async def reload_member_index():
+    async with _member_lookups_lock:
+        # 기다리는 동안 다른 적재가 끝났거나 다시 끊겼으면 건너뜀
+        if member_index.loaded or not member_index.active:
+            return
+        try:
+            await load_member_lookups()
+        except Exception as e:
+            print(f"회원 인덱스 재적재 실패: {e}")
+
+
+def on_member_listener_state(connected: bool):
+    member_index.set_active(connected)
+    # 연결 전이나 끊겨 있던 동안의 가입을 반영하도록 (재)접속 후 다시 적재
+    if connected and not member_index.loaded:
+        asyncio.get_running_loop().create_task(reload_member_index())
+
+
+async def load_today_visits():
+    async with AsyncSessionLocal() as session:
+        member_ids = await MemberVisitRepository(session).get_today_visitor_ids()
+    today_visit_cache.load(member_ids)
+
+
+async def purge_idempotency_records():
+    try:
+        async with AsyncSessionLocal() as session:
+            deleted = await IdempotencyRepository(session).delete_expired()
+        print(f"만료된 Idempotency-Key 기록 정리: {deleted}건")
+    except Exception as e:
+        print(f"Idempotency-Key 기록 정리 실패: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ------------------- 시작 -------------------
+    app.state.storage = create_s3_storage()
+
+    if settings.VISIT_CACHE_ENABLED:
+        await load_today_visits()
+    if settings.IDEMPOTENCY_ENABLED:
+        await purge_idempotency_records()
+    if settings.MEMBER_INDEX_ENABLED or settings.NAME_AUTOCOMPLETE_ENABLED:
+        pg_listener.subscribe(MEMBER_CHANNEL, on_member_added)
+    if settings.MEMBER_INDEX_ENABLED:
+        pg_listener.on_state_change(on_member_listener_state)
+    if settings.FACILITY_STATUS_CACHE_ENABLED:
+        pg_listener.subscribe(FACILITY_STATUS_CHANNEL, lambda payload: facility_status_cache.invalidate())
+        pg_listener.on_state_change(facility_status_cache.set_active)
+    if settings.FACILITY_EVENTS_ENABLED:
+        pg_listener.subscribe(FACILITY_STATUS_CHANNEL, facility_event_service.on_status_changed)
+        pg_listener.subscribe(FACILITY_RESERVATION_CHANNEL, facility_event_service.on_reservation_changed)
+        pg_listener.on_state_change(facility_event_service.on_listener_state)
+
+    await pg_listener.start()
+
+    # 회원 인덱스는 LISTEN 연결 후에 적재해야 조회와 연결 사이의 가입을 놓치지 않음
+    # (연결에 실패했으면 인덱스는 사용되지 않고, 연결되면 on_member_listener_state 가 다시 적재)
+    if settings.MEMBER_INDEX_ENABLED or settings.NAME_AUTOCOMPLETE_ENABLED:
+        async with _member_lookups_lock:
+            await load_member_lookups()
+
+    yield
+
+    # ------------------- 종료 -------------------
+    await pg_listener.stop()
+    app.state.storage.client.close()
+    app.state.storage.executor.shutdown(wait=False)
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from typing import Any, Callable
+
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.engine import make_url
+
+from core.config import settings
+
+# NOTIFY 채널
+FACILITY_STATUS_CHANNEL = "facility_status"
+FACILITY_RESERVATION_CHANNEL = "facility_reservation"
+MEMBER_CHANNEL = "member"  # 회원가입/일괄 등록 → 워커별 회원 인덱스 갱신
+
+
+def dump_payload(payload: dict[str, Any]) -> str:
+    # 같은 트랜잭션 안의 동일한 알림은 Postgres가 하나로 합치므로 공백 없이 고정된 형태로 직렬화
+    return json.dumps(payload, separators=(",", ":"))
+
+
+async def notify(session, channel: str, payload: dict[str, Any]):
+    """트랜잭션 안에서 NOTIFY 예약 (커밋될 때 모든 워커에 전달, 롤백되면 전달 안 됨)"""
+    await session.execute(select(func.pg_notify(channel, dump_payload(payload))))
+
+
+class PgListener:
+    """워커마다 하나씩 두는 Postgres LISTEN 전용 커넥션
+
+    커넥션 풀과 별개의 asyncpg 커넥션을 사용하며, 끊기면 재접속한다.
+    끊겨 있는 동안 알림을 놓칠 수 있으므로 on_state_change 로 상태를 알린다.
+    """
+
+    def __init__(self, database_url: str):
+        # SQLAlchemy URL(postgresql+asyncpg://) → asyncpg DSN(postgresql://)
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._handlers: dict[str, list[Callable[[dict], None]]] = {}
+        self._state_handlers: list[Callable[[bool], None]] = []
+        self._conn: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    def subscribe(self, channel: str, handler: Callable[[dict], None]):
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_state_change(self, handler: Callable[[bool], None]):
+        self._state_handlers.append(handler)
+
+    async def start(self):
+        if not self._handlers:
+            return
+        self._closing = False
+        try:
+            await self._connect()
+        except Exception as e:
+            print(f"LISTEN 커넥션 연결 실패: {e}")
+            self._schedule_reconnect()
+
+    async def stop(self):
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def _connect(self):
+        conn = await asyncpg.connect(self._dsn)
+        for channel in self._handlers:
+            await conn.add_listener(channel, self._dispatch)
+        conn.add_termination_listener(self._on_terminate)
+        self._conn = conn
+        self._set_state(True)
+
+    def _set_state(self, connected: bool):
+        for handler in self._state_handlers:
+            handler(connected)
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str):
+        try:
+            data = json.loads(payload) if payload else {}
+        except ValueError:
+            data = {}
+        for handler in self._handlers.get(channel, []):
+            try:
+                handler(data)
+            except Exception as e:
+                print(f"NOTIFY 처리 오류 ({channel}): {e}")
+
+    def _on_terminate(self, connection):
+        self._conn = None
+        self._set_state(False)
+        if not self._closing:
+            print("LISTEN 커넥션이 끊어져 재접속합니다")
+            self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = 1
+        while not self._closing:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+                return
+            except Exception as e:
+                print(f"LISTEN 재접속 실패: {e}")
+                delay = min(delay * 2, 30)
+
+
+pg_listener = PgListener(settings.POSTGRES_DATABASE_URL)
@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import boto3
+from botocore.config import Config
+
+from core.config import settings
+from util.metrics import registry
+from util.timer import Timer
+
+S3_REQUEST_SECONDS = registry.histogram("s3_request_seconds", "S3 요청 시간", labelnames=("operation",))
+
+
+class S3Storage:
+    """S3 업로드/삭제를 스레드 풀에서 실행하는 래퍼
+
+    boto3 는 블로킹 I/O 이므로 이벤트 루프 대신 전용 스레드 풀에서 실행한다.
+    """
+
+    def __init__(self, client, bucket: str, executor: ThreadPoolExecutor):
+        self.client = client
+        self.bucket = bucket
+        self.executor = executor
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def url_for(self, key: str) -> str:
+        return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+
+    def key_from_url(self, url: str) -> str:
+        return url.split(f"{self.bucket}.s3.amazonaws.com/")[-1]
+
+    @Timer(S3_REQUEST_SECONDS, operation="upload")
+    async def upload(self, fileobj, key: str) -> str:
+        await self._run(self.client.upload_fileobj, fileobj, self.bucket, key)
+        return self.url_for(key)
+
+    @Timer(S3_REQUEST_SECONDS, operation="delete_many")
+    async def delete_many(self, keys: list[str]) -> list[dict]:
+        """DeleteObjects 한 번으로 여러 객체 삭제 (요청당 최대 1000개), 실패한 항목 반환"""
+        errors = []
+        for i in range(0, len(keys), 1000):
+            response = await self._run(
+                self.client.delete_objects,
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[i:i + 1000]], "Quiet": True}
+            )
+            errors.extend(response.get("Errors", []))
+        return errors
+
+
+def create_s3_storage() -> S3Storage:
+    """워커당 하나만 만들어 공유 (lifespan 에서 생성)
+
+    boto3 클라이언트는 스레드 안전하므로 스레드 풀 크기만큼 커넥션을 열어 두고 재사용한다.
+    스레드 풀도 여기서 만들어 storage 와 함께 닫는다 (lifespan 이 다시 실행돼도 새 풀을 씀).
+    """
+    client = boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY.get_secret_value(),
+        region_name="ap-northeast-2",
+        config=Config(
+            max_pool_connections=settings.S3_MAX_WORKERS,
+            retries={"max_attempts": 3, "mode": "standard"},
+            tcp_keepalive=True
+        )
+    )
+    executor = ThreadPoolExecutor(max_workers=settings.S3_MAX_WORKERS, thread_name_prefix="s3")
+    return S3Storage(client, settings.AWS_BUCKET_NAME, executor)
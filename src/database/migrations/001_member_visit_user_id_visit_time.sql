@@ -0,0 +1,3 @@
+-- 오늘 방문 여부 조회 (user_id = ? AND visit_time >= CURRENT_DATE AND visit_time < CURRENT_DATE + 1)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_visit_user_id_visit_time
+    ON member_visit (user_id, visit_time);
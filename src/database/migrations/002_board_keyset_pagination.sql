@@ -0,0 +1,7 @@
+-- GET /board 최신순 커서 페이지네이션 (ORDER BY created_at DESC, id DESC)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_board_created_at_id
+    ON board (created_at, id);
+
+-- 페이지 단위 이미지 일괄 조회 (board_id IN (...))
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_board_image_board_id
+    ON board_image (board_id);
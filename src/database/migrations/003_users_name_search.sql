@@ -0,0 +1,9 @@
+-- 이름 부분/유사 검색 (ILIKE '%..%', name % :q, similarity)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_name_trgm
+    ON users USING gin (name gin_trgm_ops);
+
+-- 이름 앞부분 검색 (LIKE '..%'), DB collation 과 무관하게 사용 가능
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_name_pattern
+    ON users (name text_pattern_ops);
@@ -0,0 +1,6 @@
+-- 키오스크 오프라인 방문 동기화 (POST /users/check-in/sync)
+-- 같은 키로 다시 보낸 방문 기록은 ON CONFLICT (idempotency_key) DO NOTHING 으로 무시
+ALTER TABLE member_visit ADD COLUMN IF NOT EXISTS idempotency_key varchar(64);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_member_visit_idempotency_key
+    ON member_visit (idempotency_key);
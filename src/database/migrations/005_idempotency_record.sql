@@ -0,0 +1,14 @@
+-- Idempotency-Key 헤더로 받은 POST 요청의 첫 응답 (워커 간 공유)
+CREATE TABLE IF NOT EXISTS idempotency_record (
+    key          varchar(255) PRIMARY KEY,
+    request_hash varchar(64)  NOT NULL,
+    status_code  integer,
+    headers      json,
+    body         bytea,
+    created_at   timestamptz  NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at   timestamptz  NOT NULL
+);
+
+-- 만료 기록 정리 (DELETE FROM idempotency_record WHERE expires_at < now())
+CREATE INDEX IF NOT EXISTS ix_idempotency_record_expires_at
+    ON idempotency_record (expires_at);
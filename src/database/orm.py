@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Date, TIMESTAMP, text, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Enum, Date, TIMESTAMP, text, ForeignKey, Text, Index, JSON, LargeBinary
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import date
 
@@ -20,19 +20,29 @@ class User(Base):
     facilities = relationship("MemberFacility", back_populates="user", cascade="all, delete-orphan")
     reservations = relationship("ReservationUser", back_populates="user", cascade="all, delete-orphan")
 
-    @classmethod
-    def create(cls, member_id: str, name: str, birth: date, gender: str, phone_num: str) -> "User":
+    __table_args__ = (
+        # 이름 부분 검색 (LIKE '%..%', similarity) - pg_trgm 확장 필요
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # 이름 앞부분 검색 (LIKE '..%')
+        Index("ix_users_name_pattern", "name", postgresql_ops={"name": "text_pattern_ops"}),
+    )
+
+    @staticmethod
+    def calculate_age(birth: date) -> int:
         today = date.today()
         age = today.year - birth.year
         if (today.month, today.day) < (birth.month, birth.day):
             age -= 1
+        return age
 
+    @classmethod
+    def create(cls, member_id: str, name: str, birth: date, gender: str, phone_num: str) -> "User":
         return cls(
             member_id=member_id,
             name=name,
             gender=gender,
             birth=birth,
-            age=age,
+            age=cls.calculate_age(birth),
             phone_num=phone_num
         )
 
@@ -58,12 +68,17 @@ class Board(Base):
 
     images = relationship("BoardImage", back_populates="board", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 최신순 커서 페이지네이션 (created_at DESC, id DESC)
+        Index("ix_board_created_at_id", "created_at", "id"),
+    )
+
 
 class BoardImage(Base):
     __tablename__ = "board_image"
 
     id = Column(Integer, primary_key=True, index=True)
-    board_id = Column(Integer, ForeignKey("board.id", ondelete="CASCADE"), nullable=False)
+    board_id = Column(Integer, ForeignKey("board.id", ondelete="CASCADE"), nullable=False, index=True)
     image_url = Column(Text, nullable=False)
 
     board = relationship("Board", back_populates="images")
@@ -97,9 +112,17 @@ class MemberVisit(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(6), ForeignKey("users.member_id", ondelete="CASCADE"), nullable=False)
     visit_time = Column(TIMESTAMP(timezone=True), server_default=text("CURRENT_TIMESTAMP"), nullable=False)
+    # 키오스크가 오프라인 중 만든 방문 기록의 고유 키 (같은 기록을 여러 번 보내도 한 번만 저장)
+    idempotency_key = Column(String(64), nullable=True)
 
     user = relationship("User", back_populates="visits")
 
+    __table_args__ = (
+        # 오늘 방문 여부 조회용 (user_id, visit_time) 범위 검색
+        Index("ix_member_visit_user_id_visit_time", "user_id", "visit_time"),
+        Index("uq_member_visit_idempotency_key", "idempotency_key", unique=True),
+    )
+
 
 class FacilityReservation(Base):
     __tablename__ = "facility_reservation"
@@ -129,4 +152,20 @@ class ReservationUser(Base):
 
     @classmethod
     def create(cls, reservation_id: int, user_id: str) -> "ReservationUser":
-        return cls(reservation_id=reservation_id, user_id=user_id)
\ No newline at end of file
+        return cls(reservation_id=reservation_id, user_id=user_id)
+
+
+class IdempotencyRecord(Base):
+    """Idempotency-Key 별 첫 응답 (워커 간 공유)
+
+    status_code 가 비어 있으면 처리 중, expires_at 이 지나면 같은 키를 다시 쓸 수 있다.
+    """
+    __tablename__ = "idempotency_record"
+
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)  # method + path + body 의 sha256
+    status_code = Column(Integer, nullable=True)
+    headers = Column(JSON, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=text("CURRENT_TIMESTAMP"), nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
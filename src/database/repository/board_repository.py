@@ -1,5 +1,9 @@
+from datetime import datetime
+
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from database.orm import Board, BoardImage
 
 class BoardRepository:
@@ -9,8 +13,10 @@ class BoardRepository:
     async def create_board(self, title: str, content: str) -> Board:
         board = Board(title=title, content=content)
         self.session.add(board)
-        await self.session.commit()
+        # 커밋 뒤에 refresh 하면 트랜잭션이 다시 열려, 이어지는 S3 업로드 동안에도 커넥션을 잡으므로 커밋 전에 읽음
+        await self.session.flush()
         await self.session.refresh(board)
+        await self.session.commit()
         return board
 
     async def add_board_images(self, board_id: int, image_urls: list[str]):
@@ -22,8 +28,21 @@ class BoardRepository:
         result = await self.session.execute(select(Board).where(Board.id == board_id))
         return result.scalar_one_or_none()
 
-    async def get_all_boards(self) -> list[Board]:
-        result = await self.session.execute(select(Board))
+    async def get_boards_page(self, limit: int, after: tuple[datetime, int] | None = None) -> list[Board]:
+        """최신순 (created_at, id) 키셋 페이지 조회
+
+        이미지는 selectinload 로 페이지 전체를 IN 쿼리 한 번에 가져온다 (페이지당 쿼리 2개).
+        다음 페이지 존재 여부 확인을 위해 limit + 1 개까지 반환한다.
+        """
+        stmt = (
+            select(Board)
+            .options(selectinload(Board.images))
+            .order_by(Board.created_at.desc(), Board.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Board.created_at, Board.id) < after)
+        result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def get_board_images(self, board_id: int) -> list[str]:
@@ -50,6 +69,7 @@ class BoardRepository:
             board.title = title
         if content is not None:
             board.content = content
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(board)
+        await self.session.commit()
         return board
\ No newline at end of file
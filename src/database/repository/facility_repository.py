@@ -1,38 +1,106 @@
+from contextlib import asynccontextmanager
 from datetime import date
 
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert, literal, cast, Text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.sql.expression import delete
 from sqlalchemy.sql.functions import func
 
+from core.pubsub import notify, FACILITY_STATUS_CHANNEL, FACILITY_RESERVATION_CHANNEL
 from database.orm import FacilityReservation, ReservationUser, User, Facility, FacilityStatus, MemberFacility
+from database.statements import FACILITY_STATUS, ALL_FACILITY_STATUSES, RESERVATION_USERS
 
 
 class FacilityRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._in_unit_of_work = False
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """블록 안의 쓰기를 한 트랜잭션으로 묶어 마지막에 한 번만 커밋
+
+        예외가 나면 전체 롤백되므로 중간에 실패해도 예약/이용 기록이 남지 않는다.
+        """
+        if self._in_unit_of_work:
+            yield
+            return
+
+        self._in_unit_of_work = True
+        try:
+            yield
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self._in_unit_of_work = False
+
+    async def _commit(self):
+        # unit_of_work 안에서는 커밋을 미루고 블록 종료 시 한 번에 처리
+        if not self._in_unit_of_work:
+            await self.session.commit()
+
+    async def _notify_reservation_changed(self, reservation_id: int):
+        """예약이 속한 시설로 예약 변경 알림 (facility_id는 DB에서 찾음)
+
+        notify()와 같은 페이로드 문자열을 만들어야 한 트랜잭션 안의 알림이 하나로 합쳐진다.
+        """
+        payload = literal('{"facility_id":') + cast(FacilityReservation.facility_id, Text) + literal("}")
+        await self.session.execute(
+            select(func.pg_notify(FACILITY_RESERVATION_CHANNEL, payload))
+            .where(FacilityReservation.id == reservation_id)
+        )
 
     async def create_reservation(self, facility_id: int):
-        reservation = FacilityReservation(facility_id=facility_id)
-        self.session.add(reservation)
-        await self.session.commit()
-        await self.session.refresh(reservation)
+        # INSERT ... RETURNING 으로 commit + refresh 왕복 제거
+        stmt = (
+            insert(FacilityReservation)
+            .values(facility_id=facility_id)
+            .returning(FacilityReservation)
+        )
+        result = await self.session.execute(stmt)
+        reservation = result.scalar_one()
+        await notify(self.session, FACILITY_RESERVATION_CHANNEL, {"facility_id": facility_id})
+        await self._commit()
         return reservation
 
     async def add_reservation_user(self, reservation_id: int, user_id: str):
         reservation_user = ReservationUser(reservation_id=reservation_id, user_id=user_id)
         self.session.add(reservation_user)
-        await self.session.commit()
+        await self._notify_reservation_changed(reservation_id)
+        await self._commit()
         return reservation_user
 
+    async def add_reservation_users(self, reservation_id: int, user_ids: list[str]):
+        """여러 사용자를 한 번에 예약에 연결 (flush 시 다중 행 INSERT 한 번)"""
+        reservation_users = [
+            ReservationUser(reservation_id=reservation_id, user_id=user_id)
+            for user_id in user_ids
+        ]
+        self.session.add_all(reservation_users)
+        await self._notify_reservation_changed(reservation_id)
+        await self._commit()
+        return reservation_users
+
     async def get_reservation_users(self, reservation_id: int):
-        result = await self.session.execute(
-            select(User.member_id, User.name)
-            .join(ReservationUser, ReservationUser.user_id == User.member_id)
-            .where(ReservationUser.reservation_id == reservation_id)
-        )
+        result = await self.session.execute(RESERVATION_USERS, {"reservation_id": reservation_id})
         return [{"member_id": r[0], "name": r[1]} for r in result.fetchall()]
 
+    @staticmethod
+    def _group_reservations(rows) -> list[dict]:
+        reservations = {}
+        for r_id, user_name in rows:
+            if r_id not in reservations:
+                reservations[r_id] = {
+                    "reservation_id": r_id,
+                    "users": []
+                }
+            reservations[r_id]["users"].append(user_name)
+
+        return list(reservations.values())
+
     async def get_reservations_by_facility(self, facility_id: int):
         from sqlalchemy.future import select
 
@@ -50,33 +118,44 @@ class FacilityRepository:
         if not rows:
             return []
 
-        reservations = {}
-        for r_id, user_name in rows:
-            if r_id not in reservations:
-                reservations[r_id] = {
-                    "reservation_id": r_id,
-                    "users": []
-                }
-            reservations[r_id]["users"].append(user_name)
+        return self._group_reservations(rows)
 
-        return list(reservations.values())
+    async def get_all_reservations(self) -> dict[int, list[dict]]:
+        """전체 시설의 예약 목록 (facility_id → 예약 목록)"""
+        result = await self.session.execute(
+            select(
+                FacilityReservation.facility_id,
+                FacilityReservation.id,
+                User.name
+            )
+            .join(ReservationUser, ReservationUser.reservation_id == FacilityReservation.id)
+            .join(User, User.member_id == ReservationUser.user_id)
+        )
+
+        rows_by_facility: dict[int, list] = {}
+        for f_id, r_id, user_name in result.fetchall():
+            rows_by_facility.setdefault(f_id, []).append((r_id, user_name))
+
+        return {f_id: self._group_reservations(rows) for f_id, rows in rows_by_facility.items()}
 
     async def delete_reservation_by_id(self, reservation_id: int) -> bool:
-        stmt = delete(FacilityReservation).where(FacilityReservation.id == reservation_id)
+        stmt = (
+            delete(FacilityReservation)
+            .where(FacilityReservation.id == reservation_id)
+            .returning(FacilityReservation.facility_id)
+        )
         result = await self.session.execute(stmt)
+        facility_id = result.scalar_one_or_none()
 
-        if result.rowcount == 0:
+        if facility_id is None:
             return False  # 삭제된 행이 없으면 False 반환
 
+        await notify(self.session, FACILITY_RESERVATION_CHANNEL, {"facility_id": facility_id})
         await self.session.commit()
         return True
 
     async def get_facility_status(self, facility_id: int) -> str:
-        stmt = (
-            select(FacilityStatus.status)
-            .where(FacilityStatus.facility_id == facility_id)
-        )
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(FACILITY_STATUS, {"facility_id": facility_id})
         status = result.scalar_one_or_none()
         return status
 
@@ -92,33 +171,38 @@ class FacilityRepository:
             # 없으면 새로 생성
             new_status = FacilityStatus(facility_id=facility_id, status=status)
             self.session.add(new_status)
-            await self.session.commit()
-            return True
 
+        # 커밋 시점에 다른 워커의 상태 캐시 무효화
+        await notify(self.session, FACILITY_STATUS_CHANNEL, {"facility_id": facility_id, "status": status})
         await self.session.commit()
         return True
 
     async def get_all_facility_statuses(self):
-        stmt = select(FacilityStatus.facility_id, FacilityStatus.status)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(ALL_FACILITY_STATUSES)
         rows = result.all()
         return [{"facility_id": r.facility_id, "status": r.status} for r in rows]
 
-    async def has_used_facility_today(self, user_id: str, facility_id: int, usage_date: date) -> bool:
+    async def claim_facility_usage(self, user_ids: list[str], facility_id: int) -> set[str]:
+        """오늘 이용 기록을 원자적으로 선점
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 조회와 기록을 대신한다.
+        새로 기록된 user_id만 반환하므로, 빠진 사용자는 오늘 이미 이용한 것이다.
+        """
+        if not user_ids:
+            return set()
+        today = date.today()
         stmt = (
-            select(MemberFacility)
-            .where(MemberFacility.user_id == user_id)
-            .where(MemberFacility.facility_id == facility_id)
-            .where(MemberFacility.usage_date == usage_date)
+            pg_insert(MemberFacility)
+            .values([
+                {"user_id": user_id, "facility_id": facility_id, "usage_date": today}
+                for user_id in user_ids
+            ])
+            .on_conflict_do_nothing(
+                index_elements=[MemberFacility.user_id, MemberFacility.facility_id, MemberFacility.usage_date]
+            )
+            .returning(MemberFacility.user_id)
         )
         result = await self.session.execute(stmt)
-        return result.first() is not None
-
-    async def log_facility_usage(self, user_id: str, facility_id: int):
-        log = MemberFacility(
-            user_id=user_id,
-            facility_id=facility_id,
-            usage_date=date.today()
-        )
-        self.session.add(log)
-        await self.session.commit()
\ No newline at end of file
+        claimed = set(result.scalars().all())
+        await self._commit()
+        return claimed
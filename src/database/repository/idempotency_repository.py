@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from sqlalchemy import select, delete, update, func, null
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from database.orm import IdempotencyRecord
+
+
+class IdempotencyRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def claim(self, key: str, request_hash: str, lock_seconds: int) -> tuple[bool, IdempotencyRecord | None]:
+        """키 선점 → (선점 여부, 선점 실패 시 기존 기록)
+
+        만료된 기록만 덮어쓰므로 여러 워커에서 동시에 와도 한 요청만 선점한다.
+        """
+        stmt = (
+            pg_insert(IdempotencyRecord)
+            .values(key=key, request_hash=request_hash, expires_at=func.now() + timedelta(seconds=lock_seconds))
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyRecord.key],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "status_code": null(),
+                "headers": null(),
+                "body": null(),
+                "created_at": func.now(),
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=IdempotencyRecord.expires_at < func.now()
+        ).returning(IdempotencyRecord.key)
+
+        result = await self.session.execute(stmt)
+        claimed = result.first() is not None
+        await self.session.commit()
+        if claimed:
+            return True, None
+
+        result = await self.session.execute(select(IdempotencyRecord).where(IdempotencyRecord.key == key))
+        return False, result.scalars().one_or_none()
+
+    async def extend_claim(self, key: str, lock_seconds: int):
+        """처리 중인 선점의 만료 시간 연장 (응답이 저장된 기록은 건드리지 않음)"""
+        stmt = (
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key, IdempotencyRecord.status_code.is_(None))
+            .values(expires_at=func.now() + timedelta(seconds=lock_seconds))
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def complete(self, key: str, status_code: int, headers: list, body: bytes, ttl_seconds: int):
+        """처리 결과 저장 (이후 같은 키는 이 응답을 그대로 돌려줌)"""
+        stmt = (
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .values(
+                status_code=status_code,
+                headers=headers,
+                body=body,
+                expires_at=func.now() + timedelta(seconds=ttl_seconds)
+            )
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def release(self, key: str):
+        """서버 오류로 끝난 요청의 선점 해제 (재시도 시 다시 처리)"""
+        stmt = delete(IdempotencyRecord).where(
+            IdempotencyRecord.key == key,
+            IdempotencyRecord.status_code.is_(None)
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def delete_expired(self) -> int:
+        result = await self.session.execute(
+            delete(IdempotencyRecord).where(IdempotencyRecord.expires_at < func.now())
+        )
+        await self.session.commit()
+        return result.rowcount
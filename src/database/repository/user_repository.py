@@ -1,11 +1,20 @@
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, func, or_, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import Select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from typing import Any, Optional
 from datetime import date
 
+from core.pubsub import notify, MEMBER_CHANNEL
 from database.orm import User
+from database.statements import (
+    USER_BY_FIELD, USER_BY_NAME_AND_BIRTH, USER_BY_NAME_BIRTH_PHONE, USER_BY_PHONE_NUM
+)
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -13,9 +22,7 @@ class UserRepository:
 
     async def _get_user_by_fieldf(self, field_name: str, value: Any) -> Optional[User]:
         try:
-            field = getattr(User, field_name)
-            stmt: Select = select(User).where(field == value)
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(USER_BY_FIELD[field_name], {"value": value})
             return result.scalars().one_or_none()
 
         except SQLAlchemyError as e:
@@ -29,16 +36,9 @@ class UserRepository:
     async def get_user_by_memberid(self, member_id: str) -> Optional[User]:
         return await self._get_user_by_fieldf("member_id", member_id)
 
-    async def get_user_by_phone_num(self, phone_num: str) -> Optional[User]:
-        return await self._get_user_by_fieldf("phone_num", phone_num)
-
     async def get_user_by_name_and_birth(self, name: str, birth: str) -> Optional[User]:
         try:
-            stmt: Select = select(User).where(
-                User.name == name,
-                User.birth == birth
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(USER_BY_NAME_AND_BIRTH, {"name": name, "birth": birth})
             return result.scalars().all()
         except SQLAlchemyError as e:
             print(f"DB 조회 오류: {e}")
@@ -47,29 +47,91 @@ class UserRepository:
             print(f"예기치 못한 오류: {e}")
             raise
 
-    async def save_user(self, user: User) -> User:
+    async def get_users_by_name_and_birth_pairs(self, pairs: list[tuple[str, date]]) -> list[User]:
+        """WHERE (name, birth) IN (...) 한 번으로 여러 회원 조회"""
+        if not pairs:
+            return []
         try:
-            self.session.add(user)
-            await self.session.commit()
-            await self.session.refresh(user)
-            return user
+            stmt: Select = select(User).where(tuple_(User.name, User.birth).in_(pairs))
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            print(f"DB 조회 오류: {e}")
+            raise
 
+    async def get_users_by_member_ids(self, member_ids: list[str]) -> list[User]:
+        """WHERE member_id IN (...) 한 번으로 여러 회원 조회"""
+        if not member_ids:
+            return []
+        try:
+            stmt: Select = select(User).where(User.member_id.in_(member_ids))
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            print(f"DB 저장 오류: {e}")
+            print(f"DB 조회 오류: {e}")
             raise
 
-        except Exception as e:
-            print(f"예기치 못한 오류: {e}")
+    async def get_member_lookup_rows(self):
+        """인메모리 인덱스 적재용 (member_id, name, birth, phone_num) 전체 조회"""
+        try:
+            stmt = select(User.member_id, User.name, User.birth, User.phone_num)
+            result = await self.session.execute(stmt)
+            return result.all()
+        except SQLAlchemyError as e:
+            print(f"DB 조회 오류: {e}")
             raise
 
-    async def get_user_by_name_birth_phone(self, name: str, birth: date, phone: str):
-        from sqlalchemy.future import select
+    async def create_user(self, user: User) -> Optional[str]:
+        """INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 등록
+
+        등록되면 None, 유니크 제약(phone_num, member_id)에 걸리면 충돌한 컬럼명을 반환한다.
+        어느 제약인지 확인하는 조회는 충돌했을 때만 실행된다.
+        등록되면 커밋 시점에 MEMBER_CHANNEL 로 다른 워커의 회원 인덱스에 알린다.
+        """
+        try:
+            stmt = (
+                pg_insert(User)
+                .values(
+                    member_id=user.member_id,
+                    name=user.name,
+                    gender=user.gender,
+                    birth=user.birth,
+                    age=user.age,
+                    phone_num=user.phone_num
+                )
+                .on_conflict_do_nothing()
+                .returning(User.created_at)
+            )
+            result = await self.session.execute(stmt)
+            created_at = result.scalar_one_or_none()
+            if created_at is not None:
+                await notify(self.session, MEMBER_CHANNEL, {
+                    "member_id": user.member_id,
+                    "name": user.name,
+                    "birth": user.birth.isoformat(),
+                    "phone": user.phone_num
+                })
+            await self.session.commit()
+
+            if created_at is not None:
+                user.created_at = created_at
+                return None
+
+            result = await self.session.execute(
+                select(User.phone_num)
+                .where(or_(User.member_id == user.member_id, User.phone_num == user.phone_num))
+            )
+            if user.phone_num in result.scalars().all():
+                return "phone_num"
+            return "member_id"
+
+        except SQLAlchemyError as e:
+            print(f"DB 저장 오류: {e}")
+            raise
 
+    async def get_user_by_name_birth_phone(self, name: str, birth: date, phone: str):
         result = await self.session.execute(
-            select(User)
-            .where(User.name == name)
-            .where(User.birth == birth)
-            .where(User.phone_num == phone)
+            USER_BY_NAME_BIRTH_PHONE, {"name": name, "birth": birth, "phone_num": phone}
         )
         return result.scalar_one_or_none()
 
@@ -87,7 +149,119 @@ class UserRepository:
             print(f"DB 조회 오류: {e}")
             raise
 
+    async def get_users_page(self, limit: int, after_member_id: str | None = None, name: str | None = None):
+        """member_id 순 키셋 페이지 조회 (다음 페이지 확인용으로 limit + 1 개까지 반환)"""
+        try:
+            stmt = select(User)
+            if name:
+                stmt = stmt.where(User.name.like(f"%{_escape_like(name)}%"))
+            if after_member_id is not None:
+                stmt = stmt.where(User.member_id > after_member_id)
+            stmt = stmt.order_by(User.member_id).limit(limit + 1)
+
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
+
+        except SQLAlchemyError as e:
+            print(f"DB 조회 오류: {e}")
+            raise
+
+    async def search_users_by_name(self, query: str, limit: int, prefix: bool = False):
+        """이름 검색
+
+        prefix: LIKE 'q%' (text_pattern_ops B-tree 인덱스)
+        그 외: 부분 일치 또는 유사한 이름을 similarity 순으로 (pg_trgm GIN 인덱스)
+        """
+        try:
+            escaped = _escape_like(query)
+            if prefix:
+                stmt = (
+                    select(User)
+                    .where(User.name.like(f"{escaped}%"))
+                    .order_by(User.name, User.member_id)
+                )
+            else:
+                similarity = func.similarity(User.name, query)
+                stmt = (
+                    select(User)
+                    .where(or_(User.name.ilike(f"%{escaped}%"), User.name.op("%")(query)))
+                    .order_by(similarity.desc(), User.name, User.member_id)
+                )
+
+            result = await self.session.execute(stmt.limit(limit))
+            return result.scalars().all()
+
+        except SQLAlchemyError as e:
+            print(f"DB 조회 오류: {e}")
+            raise
+
+    IMPORT_COLUMNS = ["row_no", "member_id", "name", "gender", "birth", "age", "phone_num"]
+
+    async def bulk_import_users(self, records: list[tuple]) -> tuple[list[int], dict[int, str]]:
+        """COPY 로 임시 테이블에 적재한 뒤 INSERT ... SELECT 한 번으로 등록
+
+        records: IMPORT_COLUMNS 순서의 튜플 목록
+        반환: (등록된 row_no 목록, {row_no: 충돌 코드})
+        """
+        try:
+            await self.session.execute(text(
+                "CREATE TEMP TABLE users_import ("
+                " row_no integer PRIMARY KEY, member_id text, name text, gender text,"
+                " birth date, age integer, phone_num text"
+                ") ON COMMIT DROP"
+            ))
+
+            # SQLAlchemy 세션과 같은 커넥션/트랜잭션에서 asyncpg COPY 실행
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "users_import", records=records, columns=self.IMPORT_COLUMNS
+            )
+
+            result = await self.session.execute(text(
+                "SELECT s.row_no,"
+                " EXISTS (SELECT 1 FROM users u WHERE u.phone_num = s.phone_num) AS phone_conflict,"
+                " EXISTS (SELECT 1 FROM users u WHERE u.member_id = s.member_id) AS member_id_conflict"
+                " FROM users_import s"
+            ))
+            conflicts = {}
+            for row_no, phone_conflict, member_id_conflict in result.all():
+                if phone_conflict:
+                    conflicts[row_no] = "PHONE_NUM_CONFLICT"
+                elif member_id_conflict:
+                    conflicts[row_no] = "MEMBER_ID_CONFLICT"
+
+            # 등록된 회원마다 MEMBER_CHANNEL 알림 (커밋 시점에 다른 워커의 회원 인덱스에 전달)
+            result = await self.session.execute(text(
+                "WITH inserted AS ("
+                " INSERT INTO users (member_id, name, gender, birth, age, phone_num)"
+                " SELECT s.member_id, s.name, s.gender::gender_type, s.birth, s.age, s.phone_num"
+                " FROM users_import s"
+                " WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.phone_num = s.phone_num)"
+                " AND NOT EXISTS (SELECT 1 FROM users u WHERE u.member_id = s.member_id)"
+                " ORDER BY s.row_no"
+                " ON CONFLICT DO NOTHING"
+                " RETURNING member_id, name, birth, phone_num"
+                ")"
+                " SELECT member_id, pg_notify(:channel, json_build_object("
+                "'member_id', member_id, 'name', name, 'birth', birth, 'phone', phone_num)::text)"
+                " FROM inserted"
+            ), {"channel": MEMBER_CHANNEL})
+            inserted_member_ids = set(result.scalars().all())
+            await self.session.commit()
+
+            inserted = [r[0] for r in records if r[1] in inserted_member_ids]
+            # 조회와 등록 사이에 다른 요청이 먼저 등록한 경우
+            for r in records:
+                if r[0] not in conflicts and r[1] not in inserted_member_ids:
+                    conflicts[r[0]] = "CONFLICT"
+            return inserted, conflicts
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            print(f"DB 저장 오류: {e}")
+            raise
+
     async def find_user_by_phone(self, phone_number: str):
-        stmt = select(User).where(User.phone_num == phone_number)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(USER_BY_PHONE_NUM, {"phone_num": phone_number})
         return result.scalars().first()
\ No newline at end of file
@@ -1,40 +1,138 @@
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, exists, false
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import date
 
-from database.orm import MemberVisit
+from cache.visit_cache import TodayVisitCache
+from database.orm import MemberVisit, User
+from database.statements import visited_today, VISIT_TODAY, VISITORS_TODAY
 
 
 class MemberVisitRepository:
-    def __init__(self, session):
+    def __init__(self, session, visit_cache: TodayVisitCache | None = None):
         self.session = session
+        self.visit_cache = visit_cache
 
     async def has_any_visit_today(self, member_ids: list[str]) -> bool:
         """여러 member_id 중 하루 방문 기록이 있는지 체크"""
         if not member_ids:
             return False
 
-        stmt = (
-            select(func.count())
-            .where(MemberVisit.user_id.in_(member_ids))
-            .where(func.date(MemberVisit.visit_time) == func.current_date())  # DB 기준 날짜 비교
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar() > 0
+        if self.visit_cache and self.visit_cache.contains_any(member_ids):
+            return True
+
+        result = await self.session.execute(VISITORS_TODAY, {"member_ids": member_ids})
+        visited = result.scalars().all()
+
+        if self.visit_cache:
+            self.visit_cache.add_all(visited)
+        return len(visited) > 0
+
+    def has_cached_visit_today(self, member_ids: list[str]) -> bool:
+        """캐시만 보고 오늘 방문 기록이 확인되는지 (False 면 DB 확인 필요)"""
+        return bool(self.visit_cache) and self.visit_cache.contains_any(member_ids)
 
     async def has_visit_today(self, member_id: str) -> bool:
         """단일 member_id 하루 방문 체크"""
-        stmt = (
-            select(func.count())
-            .where(MemberVisit.user_id == member_id)
-            .where(func.date(MemberVisit.visit_time) == func.current_date())
+        if self.visit_cache and self.visit_cache.contains(member_id):
+            return True
+
+        result = await self.session.execute(VISIT_TODAY, {"member_id": member_id})
+        visited = result.first() is not None
+
+        if visited and self.visit_cache:
+            self.visit_cache.add(member_id)
+        return visited
+
+    async def get_today_visitor_ids(self) -> list[str]:
+        """오늘 방문한 member_id 목록 (캐시 적재용)"""
+        stmt = select(MemberVisit.user_id).where(visited_today()).distinct()
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def check_in_by_name_and_birth(self, name: str, birth: date, enforce_daily_limit: bool):
+        """회원 조회, 오늘 방문 확인, 방문 기록을 CTE 하나로 처리 (DB 왕복 1회)
+
+        (name, birth)가 한 명일 때만 방문을 기록하며, enforce_daily_limit 이면
+        오늘 이미 방문한 경우 기록하지 않는다.
+        반환: 일치한 회원마다 (member_id, name, birth, phone_num, visited_today, inserted)
+        """
+        matched = (
+            select(User.member_id, User.name, User.birth, User.phone_num)
+            .where(User.name == name, User.birth == birth)
+            .cte("matched")
+        )
+
+        insert_conditions = [select(func.count()).select_from(matched).scalar_subquery() == 1]
+        if enforce_daily_limit:
+            visited = (
+                select(MemberVisit.user_id)
+                .where(MemberVisit.user_id.in_(select(matched.c.member_id)))
+                .where(visited_today())
+                .cte("visited")
+            )
+            visited_flag = matched.c.member_id.in_(select(visited.c.user_id))
+            insert_conditions.append(~exists(select(visited.c.user_id)))
+        else:
+            visited_flag = false()
+
+        inserted = (
+            insert(MemberVisit)
+            .from_select(["user_id"], select(matched.c.member_id).where(*insert_conditions))
+            .returning(MemberVisit.user_id)
+            .cte("inserted")
+        )
+
+        stmt = select(
+            matched.c.member_id,
+            matched.c.name,
+            matched.c.birth,
+            matched.c.phone_num,
+            visited_flag.label("visited_today"),
+            matched.c.member_id.in_(select(inserted.c.user_id)).label("inserted")
         )
         result = await self.session.execute(stmt)
-        return result.scalar() > 0
+        rows = result.all()
+        await self.session.commit()
+
+        if self.visit_cache:
+            self.visit_cache.add_all(r.member_id for r in rows if r.visited_today or r.inserted)
+        return rows
 
     async def add_visit(self, member_id: str):
         """방문 기록 추가"""
         visit = MemberVisit(user_id=member_id)
         self.session.add(visit)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(visit)
-        return visit
\ No newline at end of file
+        await self.session.commit()
+
+        if self.visit_cache:
+            self.visit_cache.add(member_id)
+        return visit
+
+    async def add_synced_visits(self, visits: list[dict]) -> set[str]:
+        """키오스크에서 오프라인 중 쌓인 방문 기록을 다중 행 INSERT 한 번으로 저장
+
+        visits: {"user_id", "visit_time", "idempotency_key"} 목록 (visit_time 은 키오스크 기록 시각 그대로)
+        이미 저장된 idempotency_key 는 건너뛰고, 이번에 새로 저장된 키만 반환
+        """
+        if not visits:
+            return set()
+
+        stmt = (
+            pg_insert(MemberVisit)
+            .values(visits)
+            .on_conflict_do_nothing(index_elements=[MemberVisit.idempotency_key])
+            .returning(MemberVisit.idempotency_key)
+        )
+        result = await self.session.execute(stmt)
+        inserted = set(result.scalars().all())
+        await self.session.commit()
+
+        if self.visit_cache:
+            today = date.today()
+            self.visit_cache.add_all(
+                v["user_id"] for v in visits
+                if v["idempotency_key"] in inserted and v["visit_time"].astimezone().date() == today
+            )
+        return inserted
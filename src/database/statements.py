@@ -0,0 +1,69 @@
+"""요청마다 실행되는 조회 쿼리 (모듈 로드 시 한 번만 만들어 둠)
+
+select() 를 호출마다 새로 만들면 구성 비용과 컴파일 캐시 키 계산을 매번 치른다.
+값은 bindparam 으로 남겨 두고 같은 문장 객체를 재사용하면 캐시 키가 객체에 메모되어
+바로 컴파일 캐시를 찾는다 (비교: python -m bench.statements).
+
+    await session.execute(USER_BY_PHONE_NUM, {"phone_num": phone_num})
+
+값 목록은 expanding bindparam 을 쓰며, 문장을 호출 인자에 따라 조립해야 하는 쿼리는 각 레포지토리에 둔다.
+"""
+from sqlalchemy import select, bindparam, and_, func
+
+from database.orm import User, MemberVisit, FacilityStatus, ReservationUser
+
+
+def visited_today():
+    """오늘(DB 기준 날짜) 방문 조건
+
+    func.date(visit_time)로 감싸면 인덱스를 못 타므로
+    [오늘 00:00, 내일 00:00) 반열린 구간으로 비교한다.
+    """
+    today = func.current_date()
+    return and_(
+        MemberVisit.visit_time >= today,
+        MemberVisit.visit_time < today + 1
+    )
+
+
+# ------------------- 회원 -------------------
+USER_BY_NAME_AND_BIRTH = select(User).where(User.name == bindparam("name"), User.birth == bindparam("birth"))
+
+USER_BY_NAME_BIRTH_PHONE = select(User).where(
+    User.name == bindparam("name"),
+    User.birth == bindparam("birth"),
+    User.phone_num == bindparam("phone_num")
+)
+
+USER_BY_PHONE_NUM = select(User).where(User.phone_num == bindparam("phone_num"))
+
+# UserRepository._get_user_by_fieldf 용 (컬럼명 → 문장, 값은 "value")
+USER_BY_FIELD = {
+    "member_id": select(User).where(User.member_id == bindparam("value")),
+}
+
+# ------------------- 방문 -------------------
+VISIT_TODAY = (
+    select(MemberVisit.id)
+    .where(MemberVisit.user_id == bindparam("member_id"))
+    .where(visited_today())
+    .limit(1)
+)
+
+VISITORS_TODAY = (
+    select(MemberVisit.user_id)
+    .where(MemberVisit.user_id.in_(bindparam("member_ids", expanding=True)))
+    .where(visited_today())
+    .distinct()
+)
+
+# ------------------- 시설 -------------------
+FACILITY_STATUS = select(FacilityStatus.status).where(FacilityStatus.facility_id == bindparam("facility_id"))
+
+ALL_FACILITY_STATUSES = select(FacilityStatus.facility_id, FacilityStatus.status)
+
+RESERVATION_USERS = (
+    select(User.member_id, User.name)
+    .join(ReservationUser, ReservationUser.user_id == User.member_id)
+    .where(ReservationUser.reservation_id == bindparam("reservation_id"))
+)
@@ -0,0 +1,348 @@
+"""경로당/복지관 데이터와 비슷한 모양의 합성 데이터 생성 (벤치마크, 쿼리 플랜 확인용)
+
+    PYTHONPATH=src python -m database.synthetic --members 1000000 --truncate --seed 7
+
+- 이름: 실제 성씨 비율 + 어르신 세대에 흔한 이름 → 동명이인이 많고,
+  collision_rate 만큼은 이름과 생년월일까지 같은 회원 (multiple/candidates 분기)
+- 방문 기록: visit_days 일 동안 (일요일 휴관), 자주 오는 회원에게 몰리고 오전에 몰림
+- 시설 이용: 방문자 일부가 인기 시설 위주(Zipf 분포)로 이용
+- 대기 중인 예약, 게시글/이미지
+
+모든 분포는 seed 로 고정되며, ORM 을 거치지 않고 asyncpg COPY 로 적재한다.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta
+from itertools import accumulate
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database.orm import Base
+
+MAX_MEMBERS = 1_000_000  # member_id 는 6자리
+
+# 통계청 성씨 비율 상위 (%)
+SURNAMES = {
+    "김": 21.6, "이": 14.8, "박": 8.5, "최": 4.7, "정": 4.4, "강": 2.4, "조": 2.1, "윤": 2.1, "장": 2.0, "임": 1.7,
+    "한": 1.5, "오": 1.5, "서": 1.5, "신": 1.4, "권": 1.4, "황": 1.4, "안": 1.4, "송": 1.3, "류": 1.2, "전": 1.1,
+    "홍": 1.1, "고": 0.9, "문": 0.9, "양": 0.9, "손": 0.9, "배": 0.8, "백": 0.8, "허": 0.7, "유": 0.6, "남": 0.6,
+}
+# 1935~1965년생에 흔한 이름 (앞쪽일수록 흔함)
+FEMALE_NAMES = [
+    "영숙", "정숙", "영자", "순자", "영희", "정희", "명숙", "경숙", "춘자", "말순", "옥순", "미숙", "영순", "정자",
+    "순옥", "숙자", "영옥", "복순", "순희", "정순", "금순", "옥자", "명자", "정옥", "귀례", "필순", "점순", "분남",
+]
+MALE_NAMES = [
+    "영수", "영호", "영철", "정호", "성수", "상철", "영식", "정수", "병철", "광수", "종수", "진호", "영길", "동수",
+    "재호", "성호", "만수", "춘식", "용수", "기철", "석진", "봉수", "남수", "태식",
+]
+# 인기순 (Zipf 분포 순위)
+FACILITIES = ["안마의자", "탁구대", "노래방", "당구대", "족욕기", "헬스기구", "바둑판", "컴퓨터", "장기판", "물리치료기"]
+# 09~17시 시간대별 방문 비중 (오전에 몰림)
+VISIT_HOUR_WEIGHTS = [14, 22, 18, 9, 11, 10, 8, 5, 3]
+RESERVATION_GROUP_WEIGHTS = [50, 30, 12, 8]  # 예약 인원 1~4명
+BOARD_TITLES = ["프로그램 안내", "휴관 안내", "건강 강좌", "나들이 신청", "식단표", "시설 점검 안내", "동아리 모집"]
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    # SQLAlchemy URL(postgresql+asyncpg://) → asyncpg DSN(postgresql://)
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def _zipf_weights(count: int, skew: float) -> list[float]:
+    return [1 / rank ** skew for rank in range(1, count + 1)]
+
+
+class SyntheticDataset:
+    """seed 가 같으면 같은 데이터를 만드는 생성기 (테이블별로 COPY 할 행을 만든다)"""
+
+    def __init__(
+        self,
+        members: int = 10_000,
+        seed: int = 42,
+        collision_rate: float = 0.03,
+        visit_days: int = 365,
+        visits_per_day: int = 300,
+        facility_usage_rate: float = 0.4,
+        facility_skew: float = 1.1,
+        facilities: int = 8,
+        reservations: int = 200,
+        boards: int = 200,
+        image_base_url: str = "https://bench.s3.amazonaws.com",
+        today: date | None = None
+    ):
+        if not 1 <= members <= MAX_MEMBERS:
+            raise ValueError(f"members 는 1 ~ {MAX_MEMBERS} 사이여야 합니다")
+        if not 1 <= facilities <= len(FACILITIES):
+            raise ValueError(f"facilities 는 1 ~ {len(FACILITIES)} 사이여야 합니다")
+        self.members = members
+        self.seed = seed
+        self.collision_rate = collision_rate
+        self.visit_days = visit_days
+        self.visits_per_day = visits_per_day
+        self.facility_usage_rate = facility_usage_rate
+        self.facility_weights = _zipf_weights(facilities, facility_skew)
+        self.facility_ids = list(range(1, facilities + 1))
+        self.reservations = reservations
+        self.boards = boards
+        self.image_base_url = image_base_url
+        self.today = today or date.today()
+        self.tz = datetime.now().astimezone().tzinfo
+
+        self._member_ids: list[str] | None = None
+        self._member_cum_weights: list[float] | None = None
+
+    def _rng(self, table: str) -> random.Random:
+        # 테이블마다 독립된 난수열 → 한 테이블의 설정을 바꿔도 다른 테이블 데이터는 그대로
+        return random.Random(f"{self.seed}:{table}")
+
+    # ------------------- 회원 -------------------
+    def users(self):
+        """(member_id, name, gender, birth, age, phone_num, created_at)"""
+        rng = self._rng("users")
+        surnames, surname_weights = list(SURNAMES), list(accumulate(SURNAMES.values()))
+        female_weights = list(accumulate(_zipf_weights(len(FEMALE_NAMES), 0.9)))
+        male_weights = list(accumulate(_zipf_weights(len(MALE_NAMES), 0.9)))
+        created_from = datetime.combine(self.today - timedelta(days=3 * 365), dt_time(9), self.tz)
+
+        # 전화번호는 10^8 과 서로소인 수를 곱해 섞음 → 겹치지 않음
+        phone_offset = rng.randrange(10 ** 8)
+        existing: list[tuple[str, str, date]] = []
+        for i in range(self.members):
+            if existing and rng.random() < self.collision_rate:
+                # 이름과 생년월일까지 같은 회원
+                name, gender, birth = rng.choice(existing)
+            else:
+                gender = "female" if rng.random() < 0.62 else "male"
+                given = (
+                    rng.choices(FEMALE_NAMES, cum_weights=female_weights)[0] if gender == "female"
+                    else rng.choices(MALE_NAMES, cum_weights=male_weights)[0]
+                )
+                name = rng.choices(surnames, cum_weights=surname_weights)[0] + given
+                birth = date(round(rng.triangular(1935, 1965, 1950)), rng.randint(1, 12), rng.randint(1, 28))
+                existing.append((name, gender, birth))
+
+            age = self.today.year - birth.year - ((self.today.month, self.today.day) < (birth.month, birth.day))
+            phone = f"010{(i * 48271 + phone_offset) % 10 ** 8:08d}"
+            created_at = created_from + timedelta(minutes=rng.randrange(3 * 365 * 24 * 60))
+            yield f"{i:06d}", name, gender, birth, age, phone, created_at
+
+    def _visit_weights(self) -> tuple[list[str], list[float]]:
+        """회원별 방문 빈도 (소수의 단골이 대부분의 방문을 차지)"""
+        if self._member_ids is None:
+            rng = self._rng("visit_weights")
+            self._member_ids = [f"{i:06d}" for i in range(self.members)]
+            self._member_cum_weights = list(accumulate(rng.paretovariate(1.5) for _ in range(self.members)))
+        return self._member_ids, self._member_cum_weights
+
+    def _open_days(self):
+        for offset in range(self.visit_days, 0, -1):
+            day = self.today - timedelta(days=offset)
+            if day.weekday() != 6:  # 일요일 휴관
+                yield day
+
+    def _visitor_days(self):
+        """(날짜, 그날 방문한 member_id 목록) - 오늘은 비워둠 (오늘 첫 방문 흐름을 측정하도록)"""
+        rng = self._rng("visitors")
+        member_ids, cum_weights = self._visit_weights()
+        for day in self._open_days():
+            count = max(0, round(rng.gauss(self.visits_per_day, self.visits_per_day * 0.15)))
+            visitors = dict.fromkeys(rng.choices(member_ids, cum_weights=cum_weights, k=count))
+            yield day, list(visitors)
+
+    def member_visits(self):
+        """(user_id, visit_time)"""
+        rng = self._rng("member_visit")
+        hours = list(range(9, 9 + len(VISIT_HOUR_WEIGHTS)))
+        for day, visitors in self._visitor_days():
+            for member_id in visitors:
+                hour = rng.choices(hours, weights=VISIT_HOUR_WEIGHTS)[0]
+                yield member_id, datetime.combine(day, dt_time(hour, rng.randrange(60), rng.randrange(60)), self.tz)
+
+    def member_facilities(self):
+        """(user_id, facility_id, usage_date) - 방문자 중 일부가 인기 시설 위주로 이용"""
+        rng = self._rng("member_facility")
+        for day, visitors in self._visitor_days():
+            for member_id in visitors:
+                if rng.random() >= self.facility_usage_rate:
+                    continue
+                used = {rng.choices(self.facility_ids, weights=self.facility_weights)[0]}
+                if rng.random() < 0.2:
+                    used.add(rng.choices(self.facility_ids, weights=self.facility_weights)[0])
+                for facility_id in used:
+                    yield member_id, facility_id, day
+
+    # ------------------- 시설/예약 -------------------
+    def facilities(self):
+        return [(f_id, FACILITIES[f_id - 1]) for f_id in self.facility_ids]
+
+    def facility_statuses(self):
+        return [(f_id, f_id, "active") for f_id in self.facility_ids]
+
+    def facility_reservations(self):
+        """(id, facility_id, status, created_at) - 지금 대기 중인 예약"""
+        rng = self._rng("facility_reservation")
+        now = datetime.now(self.tz)
+        return [
+            (
+                r_id,
+                rng.choices(self.facility_ids, weights=self.facility_weights)[0],
+                "available",
+                now - timedelta(minutes=rng.randrange(120))
+            )
+            for r_id in range(1, self.reservations + 1)
+        ]
+
+    def reservation_users(self):
+        """(reservation_id, user_id)"""
+        rng = self._rng("reservation_user")
+        member_ids, _ = self._visit_weights()
+        for r_id in range(1, self.reservations + 1):
+            size = rng.choices(range(1, 5), weights=RESERVATION_GROUP_WEIGHTS)[0]
+            for member_id in rng.sample(member_ids, min(size, len(member_ids))):
+                yield r_id, member_id
+
+    # ------------------- 게시판 -------------------
+    def boards_rows(self):
+        """(id, title, content, created_at)"""
+        rng = self._rng("board")
+        end = datetime.combine(self.today, dt_time(9), self.tz)
+        return [
+            (
+                b_id,
+                f"{rng.choice(BOARD_TITLES)} ({b_id})",
+                "자세한 내용은 사무실로 문의해 주세요.",
+                end - timedelta(minutes=rng.randrange(self.visit_days * 24 * 60 or 1))
+            )
+            for b_id in range(1, self.boards + 1)
+        ]
+
+    def board_images(self):
+        """(board_id, image_url) - 게시글마다 0~3장"""
+        rng = self._rng("board_image")
+        for b_id in range(1, self.boards + 1):
+            for _ in range(rng.choices(range(4), weights=[40, 35, 15, 10])[0]):
+                yield b_id, f"{self.image_base_url}/board/{uuid.UUID(int=rng.getrandbits(128))}_{b_id}.jpg"
+
+
+# ------------------- 적재 -------------------
+TABLES = (
+    "users", "member_visit", "member_facility", "facility", "facility_status",
+    "facility_reservation", "reservation_user", "board", "board_image",
+)
+
+
+async def create_tables(database_url: str):
+    """database/orm.py 기준으로 테이블 생성 (pg_trgm 인덱스 포함)"""
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+
+async def load_dataset(conn: asyncpg.Connection, dataset: SyntheticDataset, truncate: bool = False) -> dict[str, int]:
+    """한 트랜잭션 안에서 테이블별 COPY, 테이블별 적재 행 수 반환"""
+    copies = [
+        ("users", dataset.users(), ["member_id", "name", "gender", "birth", "age", "phone_num", "created_at"]),
+        ("member_visit", dataset.member_visits(), ["user_id", "visit_time"]),
+        ("facility", dataset.facilities(), ["id", "facility_name"]),
+        ("facility_status", dataset.facility_statuses(), ["id", "facility_id", "status"]),
+        ("member_facility", dataset.member_facilities(), ["user_id", "facility_id", "usage_date"]),
+        ("facility_reservation", dataset.facility_reservations(), ["id", "facility_id", "status", "created_at"]),
+        ("reservation_user", dataset.reservation_users(), ["reservation_id", "user_id"]),
+        ("board", dataset.boards_rows(), ["id", "title", "content", "created_at"]),
+        ("board_image", dataset.board_images(), ["board_id", "image_url"]),
+    ]
+
+    counts = {}
+    async with conn.transaction():
+        if truncate:
+            await conn.execute(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+
+        for table, records, columns in copies:
+            result = await conn.copy_records_to_table(table, records=records, columns=columns)
+            # 'COPY 12345'
+            counts[table] = int(result.split()[-1])
+
+        # id 를 직접 넣은 테이블은 시퀀스를 맞춤
+        for table in ("facility", "facility_status", "facility_reservation", "board"):
+            await conn.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+            )
+
+    await conn.execute("ANALYZE")
+    return counts
+
+
+def build_parser(description: str = "합성 데이터 적재") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--members", type=int, default=10_000, help=f"회원 수 (최대 {MAX_MEMBERS})")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--collision-rate", type=float, default=0.03, help="이름과 생년월일이 같은 회원 비율")
+    parser.add_argument("--visit-days", type=int, default=365, help="방문 기록을 만들 지난 일수")
+    parser.add_argument("--visits-per-day", type=int, default=300, help="하루 평균 방문자 수")
+    parser.add_argument("--facility-usage-rate", type=float, default=0.4, help="방문자 중 시설 이용 비율")
+    parser.add_argument("--facility-skew", type=float, default=1.1, help="시설 인기도 Zipf 지수")
+    parser.add_argument("--facilities", type=int, default=8)
+    parser.add_argument("--reservations", type=int, default=200, help="지금 대기 중인 예약 수")
+    parser.add_argument("--boards", type=int, default=200)
+    parser.add_argument("--truncate", action="store_true", help="기존 데이터를 지우고 적재")
+    parser.add_argument("--create-tables", action="store_true", help="database/orm.py 기준으로 테이블 생성")
+    return parser
+
+
+def dataset_from_args(args) -> SyntheticDataset:
+    return SyntheticDataset(
+        members=args.members,
+        seed=args.seed,
+        collision_rate=args.collision_rate,
+        visit_days=args.visit_days,
+        visits_per_day=args.visits_per_day,
+        facility_usage_rate=args.facility_usage_rate,
+        facility_skew=args.facility_skew,
+        facilities=args.facilities,
+        reservations=args.reservations,
+        boards=args.boards
+    )
+
+
+async def run(args):
+    # 설정(.env)은 실제로 적재할 때만 읽음
+    from core.config import settings
+
+    dataset = dataset_from_args(args)
+    started = time.perf_counter()
+    if args.create_tables:
+        await create_tables(settings.POSTGRES_DATABASE_URL)
+
+    conn = await asyncpg.connect(asyncpg_dsn(settings.POSTGRES_DATABASE_URL))
+    try:
+        counts = await load_dataset(conn, dataset, truncate=args.truncate)
+    finally:
+        await conn.close()
+
+    summary = ", ".join(f"{table} {count}" for table, count in counts.items())
+    print(f"적재 완료 ({time.perf_counter() - started:.1f}초): {summary}")
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    try:
+        dataset_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
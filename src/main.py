@@ -1,10 +1,19 @@
 from fastapi import FastAPI
-from api import user, facility, board
+from api import user, facility, board, metrics
+from core.config import settings
+from core.idempotency import IdempotencyMiddleware
+from core.lifespan import lifespan
+from util.query_budget import QueryBudgetMiddleware
+from util.timer import TimingMiddleware
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 from fastapi.middleware.cors import CORSMiddleware
 
+# CORS 보다 안쪽에 두어 재전송 응답에도 CORS 헤더가 붙도록 먼저 등록
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(IdempotencyMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 배포 시에는 특정 도메인만
@@ -13,9 +22,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.QUERY_BUDGET_ENABLED:
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        budget=settings.QUERY_BUDGET,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+        raise_on_exceed=settings.QUERY_BUDGET_RAISE
+    )
+
+# 가장 바깥에서 전체 처리 시간과 쿼리 수 측정
+app.add_middleware(TimingMiddleware)
+
 app.include_router(user.router)
 app.include_router(facility.router)
 app.include_router(board.router)
+app.include_router(metrics.router)
 @app.get("/")
 async def root():
     return {"message": "Hello World"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, constr, Field
 from typing import Literal, List, Optional
-from datetime import date
+from datetime import date, datetime
 
 class SignUpRequest(BaseModel):
     member_id: constr(min_length=1, max_length=10)
@@ -13,6 +13,19 @@ class LogInRequest(BaseModel):
     name: constr(min_length=2, max_length=20)
     birth: date
 
+class OfflineCheckIn(BaseModel):
+    # 키오스크가 방문마다 만든 고유 키 (재전송 시 중복 저장 방지)
+    idempotency_key: constr(min_length=1, max_length=64)
+    visit_time: datetime
+    # member_id 가 없으면 name + birth (+ 동명이인이면 phone)으로 회원 확인
+    member_id: Optional[str] = None
+    name: Optional[str] = None
+    birth: Optional[date] = None
+    phone: Optional[str] = None
+
+class CheckInSyncRequest(BaseModel):
+    check_ins: List[OfflineCheckIn]
+
 class ConfirmPhoneRequest(BaseModel):
     name: constr(min_length=2, max_length=20)
     birth: date
@@ -1,48 +1,60 @@
 # service/board_service.py
+import asyncio
 import uuid
+from datetime import datetime
 from fastapi import HTTPException, UploadFile
 from database.repository.board_repository import BoardRepository
-import boto3
-from botocore.exceptions import BotoCoreError, NoCredentialsError
+from botocore.exceptions import BotoCoreError, ClientError
 from core.config import settings  # AWS_KEY, AWS_SECRET, AWS_BUCKET 등 환경변수
+from core.storage import S3Storage
+from util.pagination import encode_cursor, decode_cursor
+from util.timer import Timer
 
 class BoardService:
-    def __init__(self, board_repo: BoardRepository):
+    def __init__(self, board_repo: BoardRepository, storage: S3Storage):
         self.board_repo = board_repo
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY.get_secret_value(),
-            region_name="ap-northeast-2"
-        )
+        self.storage = storage
 
     async def upload_to_s3(self, file: UploadFile) -> str:
         try:
             file_key = f"board/{uuid.uuid4()}_{file.filename}"
-            self.s3_client.upload_fileobj(
-                file.file,
-                settings.AWS_BUCKET_NAME,
-                file_key,
-            )
-            return f"https://{settings.AWS_BUCKET_NAME}.s3.amazonaws.com/{file_key}"
-        except (BotoCoreError, NoCredentialsError) as e:
+            return await self.storage.upload(file.file, file_key)
+        except (BotoCoreError, ClientError) as e:
             raise HTTPException(status_code=500, detail=f"S3 업로드 실패: {str(e)}")
 
+    async def _upload_images(self, images: list[UploadFile]) -> list[dict]:
+        """이미지를 동시에 업로드하고 이미지별 결과(url, 소요 시간, 오류)를 반환"""
+        semaphore = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
+
+        async def upload(img: UploadFile) -> dict:
+            async with semaphore:
+                result = {"filename": img.filename, "url": None, "error": None}
+                with Timer() as timer:
+                    try:
+                        result["url"] = await self.upload_to_s3(img)
+                    except HTTPException as e:
+                        result["error"] = e.detail
+                result["elapsed_ms"] = timer.elapsed_ms
+                return result
+
+        return await asyncio.gather(*(upload(img) for img in images))
+
     async def create_board(self, title: str, content: str, images: list[UploadFile]):
         # 게시글 생성
         board = await self.board_repo.create_board(title, content)
 
-        # 이미지 S3 업로드
-        image_urls = []
+        # 이미지 S3 업로드 (실패한 이미지는 결과에만 표시)
+        upload_results = []
         if images:
-            for img in images:
-                url = await self.upload_to_s3(img)
-                image_urls.append(url)
-            await self.board_repo.add_board_images(board.id, image_urls)
+            upload_results = await self._upload_images(images)
+            image_urls = [r["url"] for r in upload_results if r["url"]]
+            if image_urls:
+                await self.board_repo.add_board_images(board.id, image_urls)
 
         return {
             "message": "게시글이 등록되었습니다.",
-            "board_id": board.id
+            "board_id": board.id,
+            "images": upload_results
         }
 
     async def get_board(self, board_id: int):
@@ -51,8 +63,35 @@ class BoardService:
             raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
         return board
 
-    async def get_all_boards(self):
-        return await self.board_repo.get_all_boards()
+    async def get_all_boards(self, size: int, cursor: str | None = None):
+        after = None
+        if cursor:
+            created_at, board_id = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(created_at), int(board_id))
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=400,
+                    detail={"code": "INVALID_CURSOR", "message": "잘못된 커서입니다."}
+                )
+
+        boards = await self.board_repo.get_boards_page(size, after)
+        has_next = len(boards) > size
+        boards = boards[:size]
+
+        return {
+            "items": [
+                {
+                    "id": b.id,
+                    "title": b.title,
+                    "content": b.content,
+                    "created_at": b.created_at,
+                    "image_urls": [img.image_url for img in b.images]
+                }
+                for b in boards
+            ],
+            "next_cursor": encode_cursor(boards[-1].created_at.isoformat(), boards[-1].id) if has_next else None
+        }
 
     async def update_board(self, board_id: int, title: str | None, content: str | None):
         board = await self.board_repo.update_board(board_id, title, content)
@@ -69,17 +108,18 @@ class BoardService:
         # 이미지 URL 조회
         image_urls = await self.board_repo.get_board_images(board_id)
 
-        # S3 이미지 삭제
-        for url in image_urls:
-            try:
-                key = url.split(f"{settings.AWS_BUCKET_NAME}.s3.amazonaws.com/")[-1]
-                self.s3_client.delete_object(Bucket=settings.AWS_BUCKET_NAME, Key=key)
-            except Exception as e:
-                print(f"S3 이미지 삭제 실패: {url}, {e}")
-
-        # DB 게시글 삭제
+        # DB 게시글 삭제 (커밋과 함께 커넥션을 반납한 뒤 S3 작업)
         deleted = await self.board_repo.delete_board(board_id)
         if not deleted:
             raise HTTPException(status_code=500, detail="게시글 삭제 중 오류가 발생했습니다.")
 
+        # S3 이미지 삭제 (한 번의 요청으로 일괄 삭제)
+        if image_urls:
+            try:
+                errors = await self.storage.delete_many([self.storage.key_from_url(url) for url in image_urls])
+                for error in errors:
+                    print(f"S3 이미지 삭제 실패: {error.get('Key')}, {error.get('Message')}")
+            except Exception as e:
+                print(f"S3 이미지 삭제 실패: {image_urls}, {e}")
+
         return {"message": "게시글과 이미지가 삭제되었습니다.", "board_id": board_id}
\ No newline at end of file
@@ -0,0 +1,149 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from core.config import settings
+from core.connection import AsyncSessionLocal
+from database.repository.facility_repository import FacilityRepository
+
+
+class FacilityEventService:
+    """시설 상태/예약 변경을 SSE 구독자에게 전달
+
+    NOTIFY 는 워커마다 LISTEN 커넥션 하나로 받고, 예약 목록은 변경 1건당 워커에서 한 번만 조회해
+    연결된 모든 화면에 나눠준다. 화면 수가 늘어도 DB 조회 수는 늘지 않는다.
+    """
+
+    KEEPALIVE_SECONDS = 15
+    QUEUE_SIZE = 100
+    # 같은 시설에 짧은 간격으로 들어온 알림은 한 번의 조회로 합침
+    DEBOUNCE_SECONDS = 0.05
+
+    def __init__(self):
+        self._subscribers: set[asyncio.Queue] = set()
+        self._pending: set[int] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._disconnected = False
+
+    def _spawn(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def on_listener_state(self, connected: bool):
+        """LISTEN 커넥션이 끊겼다 붙으면 그 사이 놓친 변경을 전체 상태로 다시 보냄"""
+        if not connected:
+            self._disconnected = True
+            return
+        if self._disconnected and self._subscribers:
+            self._spawn(self._resync())
+        self._disconnected = False
+
+    async def _resync(self):
+        try:
+            events = await self._snapshot(None)
+        except Exception as e:
+            print(f"시설 상태 재동기화 실패: {e}")
+            return
+        for event, data in events:
+            self._publish(event, data)
+
+    # ------------------- NOTIFY 핸들러 -------------------
+    def on_status_changed(self, payload: dict):
+        if "facility_id" not in payload:
+            return
+        self._publish("facility_status", {"facility_id": payload["facility_id"], "status": payload.get("status")})
+
+    def on_reservation_changed(self, payload: dict):
+        facility_id = payload.get("facility_id")
+        if facility_id is None or not self._subscribers or facility_id in self._pending:
+            return
+
+        self._pending.add(facility_id)
+        self._spawn(self._publish_reservations(facility_id))
+
+    async def _publish_reservations(self, facility_id: int):
+        await asyncio.sleep(self.DEBOUNCE_SECONDS)
+        self._pending.discard(facility_id)
+        try:
+            async with AsyncSessionLocal() as session:
+                reservations = await FacilityRepository(session).get_reservations_by_facility(facility_id)
+        except Exception as e:
+            print(f"예약 목록 조회 실패 (facility_id={facility_id}): {e}")
+            return
+        self._publish("reservations", {"facility_id": facility_id, "reservations": reservations})
+
+    def _publish(self, event: str, data: dict):
+        for queue in list(self._subscribers):
+            if queue.full():
+                # 느린 화면은 오래된 이벤트를 버림
+                queue.get_nowait()
+            queue.put_nowait((event, data))
+
+    # ------------------- SSE -------------------
+    @staticmethod
+    def _format(event: str, data) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+    async def _snapshot(self, facility_id: int | None) -> list[tuple[str, dict]]:
+        """연결 직후 한 번 보내는 현재 상태"""
+        async with AsyncSessionLocal() as session:
+            repo = FacilityRepository(session)
+            statuses = await repo.get_all_facility_statuses()
+            if facility_id is not None:
+                reservations = {facility_id: await repo.get_reservations_by_facility(facility_id)}
+            else:
+                reservations = await repo.get_all_reservations()
+
+        events = [
+            ("facility_status", s) for s in statuses
+            if facility_id is None or s["facility_id"] == facility_id
+        ]
+        events += [
+            ("reservations", {"facility_id": f_id, "reservations": r})
+            for f_id, r in reservations.items()
+        ]
+        return events
+
+    async def stream(self, facility_id: int | None = None) -> AsyncIterator[str]:
+        if not settings.FACILITY_EVENTS_ENABLED:
+            raise HTTPException(
+                status_code=503,
+                detail={"code": "EVENT_STREAM_UNAVAILABLE", "message": "실시간 알림을 사용할 수 없습니다."}
+            )
+
+        return self._iter_events(facility_id)
+
+    async def _iter_events(self, facility_id: int | None) -> AsyncIterator[str]:
+        # 스냅샷 조회 중 발생한 변경도 놓치지 않도록 먼저 구독
+        # 제너레이터 안에서 구독해야 첫 응답 전에 연결이 끊겨도 구독이 남지 않음 (해제는 finally)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            try:
+                snapshot = await self._snapshot(facility_id)
+            except Exception as e:
+                # 응답이 이미 시작됐으므로 스트림을 닫고 클라이언트 재접속에 맡김
+                print(f"시설 상태 스냅샷 조회 실패: {e}")
+                return
+
+            for event, data in snapshot:
+                yield self._format(event, data)
+
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=self.KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if facility_id is not None and data.get("facility_id") != facility_id:
+                    continue
+                yield self._format(event, data)
+        finally:
+            self._subscribers.discard(queue)
+
+
+facility_event_service = FacilityEventService()
@@ -1,7 +1,6 @@
-from datetime import date
-
 from fastapi import HTTPException
 
+from cache.facility_status_cache import FacilityStatusCache
 from database.repository.facility_repository import FacilityRepository
 from schema.request import FacilityReservationRequest, FacilityReservationConfirmRequest, \
     FacilityMultiReservationRequest, FacilityMultiReservationConfirmRequest
@@ -9,12 +8,34 @@ from service.user_service import UserService
 
 
 class FacilityService:
-    def __init__(self, facility_repo: FacilityRepository, user_service: UserService):
+    def __init__(
+        self,
+        facility_repo: FacilityRepository,
+        user_service: UserService,
+        status_cache: FacilityStatusCache | None = None
+    ):
         self.facility_repo = facility_repo
         self.user_service = user_service
+        self.status_cache = status_cache
+
+    def _use_status_cache(self) -> bool:
+        return self.status_cache is not None and self.status_cache.active
+
+    async def _get_cached_statuses(self) -> dict[int, str]:
+        """캐시가 비어 있으면 전체 상태를 한 번에 조회해 채움"""
+        statuses = self.status_cache.get_all()
+        if statuses is None:
+            version = self.status_cache.version
+            rows = await self.facility_repo.get_all_facility_statuses()
+            statuses = {r["facility_id"]: r["status"] for r in rows}
+            self.status_cache.set_all(statuses, version)
+        return statuses
 
     async def _check_facility_status(self, facility_id: int):
-        status = await self.facility_repo.get_facility_status(facility_id)
+        if self._use_status_cache():
+            status = (await self._get_cached_statuses()).get(facility_id)
+        else:
+            status = await self.facility_repo.get_facility_status(facility_id)
         if status is None:
             raise HTTPException(
                 status_code=404,
@@ -26,14 +47,19 @@ class FacilityService:
                 detail={"code": "FACILITY_UNAVAILABLE", "message": "해당 시설은 현재 예약이 불가능합니다."}
             )
 
-    async def _check_and_log_facility_usage(self, user_id: str, facility_id: int):
-        """하루 동일 시설 이용 여부 체크 후 로그 기록"""
-        if await self.facility_repo.has_used_facility_today(user_id, facility_id, date.today()):
-            raise HTTPException(
-                status_code=403,
-                detail={"code": "DAILY_LIMIT_REACHED", "message": "해당 시설은 오늘 이미 이용하셨습니다."}
-            )
-        await self.facility_repo.log_facility_usage(user_id, facility_id)
+    async def _claim_facility_usage(self, user_ids: list[str], facility_id: int):
+        """하루 동일 시설 이용 기록을 선점, 이미 이용한 사용자가 있으면 거부"""
+        # 같은 사람이 두 번 포함된 경우도 이미 이용한 것으로 처리
+        if len(set(user_ids)) == len(user_ids):
+            claimed = await self.facility_repo.claim_facility_usage(user_ids, facility_id)
+            if len(claimed) == len(user_ids):
+                return
+
+        # unit_of_work 안에서 발생하므로 먼저 기록된 사용자도 함께 롤백됨
+        raise HTTPException(
+            status_code=403,
+            detail={"code": "DAILY_LIMIT_REACHED", "message": "해당 시설은 오늘 이미 이용하셨습니다."}
+        )
 
     async def reservation(self, request: FacilityReservationRequest):
         await self._check_facility_status(request.facility_id)
@@ -47,10 +73,11 @@ class FacilityService:
 
         user = user_check["user"]
 
-        await self._check_and_log_facility_usage(user["member_id"], request.facility_id)
+        async with self.facility_repo.unit_of_work():
+            await self._claim_facility_usage([user["member_id"]], request.facility_id)
 
-        reservation = await self.facility_repo.create_reservation(request.facility_id)
-        await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
+            reservation = await self.facility_repo.create_reservation(request.facility_id)
+            await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
 
         return {"multiple": "false", "message": "예약이 완료되었습니다", "reservation_id": 1}
 
@@ -70,13 +97,14 @@ class FacilityService:
                 detail="선택한 전화번호에 해당하는 사용자를 찾을 수 없습니다."
             )
 
-        await self._check_and_log_facility_usage(user["member_id"], request.facility_id)
+        async with self.facility_repo.unit_of_work():
+            await self._claim_facility_usage([user["member_id"]], request.facility_id)
 
-        # 예약 생성
-        reservation = await self.facility_repo.create_reservation(request.facility_id)
+            # 예약 생성
+            reservation = await self.facility_repo.create_reservation(request.facility_id)
 
-        # 예약에 사용자 연결
-        await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
+            # 예약에 사용자 연결
+            await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
 
         # 예약에 포함된 사용자 목록
         users = await self.facility_repo.get_reservation_users(reservation.id)
@@ -104,11 +132,13 @@ class FacilityService:
         unique_multiple_set = set()  # (name, birth) 중복 체크용
         unique_members = []
 
+        # 전체 인원을 한 번에 조회
+        user_checks = await self.user_service.find_users_with_name_and_birth_bulk(
+            [(member.name, member.birth) for member in request.members]
+        )
+
         for member in request.members:
-            user_check = await self.user_service.find_users_with_name_and_birth(
-                name=member.name,
-                birth=member.birth
-            )
+            user_check = user_checks[(member.name, member.birth)]
 
             if user_check["multiple"]:
                 confirm_required = True
@@ -130,10 +160,12 @@ class FacilityService:
                 "multiple_candidates": multiple_members_info
             }
 
-        reservation = await self.facility_repo.create_reservation(request.facility_id)
-        for user in unique_members:
-            await self._check_and_log_facility_usage(user["member_id"], request.facility_id)
-            await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
+        user_ids = [user["member_id"] for user in unique_members]
+
+        async with self.facility_repo.unit_of_work():
+            await self._claim_facility_usage(user_ids, request.facility_id)
+            reservation = await self.facility_repo.create_reservation(request.facility_id)
+            await self.facility_repo.add_reservation_users(reservation.id, user_ids)
 
         return {"message": "예약이 완료되었습니다", "reservation_id": reservation.id}
 
@@ -141,13 +173,14 @@ class FacilityService:
     async def multi_confirm(self, request: FacilityMultiReservationConfirmRequest):
         await self._check_facility_status(request.facility_id)
 
-        reservation = await self.facility_repo.create_reservation(request.facility_id)
+        # 전체 인원을 한 번에 조회, 동명이인은 후보의 전화번호로 구분
+        user_checks = await self.user_service.find_users_with_name_and_birth_bulk(
+            [(member.name, member.birth) for member in request.members]
+        )
 
+        user_ids = []
         for member in request.members:
-            user_check = await self.user_service.find_users_with_name_and_birth(
-                name=member.name,
-                birth=member.birth
-            )
+            user_check = user_checks[(member.name, member.birth)]
 
             if user_check["multiple"]:
                 if not member.phone:
@@ -155,17 +188,24 @@ class FacilityService:
                         status_code=400,
                         detail=f"{member.name} (중복된 사용자)의 전화번호가 필요합니다."
                     )
-                user = await self.user_service.find_user_with_name_birth_phone(
-                    name=member.name,
-                    birth=member.birth,
-                    phone=member.phone
+                user = next(
+                    (c for c in user_check["candidates"] if c["phone"] == member.phone),
+                    None
                 )
+                if not user:
+                    raise HTTPException(
+                        status_code=404,
+                        detail="선택한 전화번호에 해당하는 사용자를 찾을 수 없습니다."
+                    )
             else:
                 user = user_check["user"]
 
-            await self._check_and_log_facility_usage(user["member_id"], request.facility_id)
+            user_ids.append(user["member_id"])
 
-            await self.facility_repo.add_reservation_user(reservation.id, user["member_id"])
+        async with self.facility_repo.unit_of_work():
+            await self._claim_facility_usage(user_ids, request.facility_id)
+            reservation = await self.facility_repo.create_reservation(request.facility_id)
+            await self.facility_repo.add_reservation_users(reservation.id, user_ids)
 
         return {
             "multiple": False,
@@ -193,6 +233,8 @@ class FacilityService:
             )
 
         updated = await self.facility_repo.update_facility_status(facility_id, status)
+        if self.status_cache:
+            self.status_cache.invalidate()
         if not updated:
             raise HTTPException(
                 status_code=404,
@@ -202,5 +244,9 @@ class FacilityService:
         return {"message": f"시설 상태가 {status}로 변경되었습니다."}
 
     async def get_all_facility_statuses(self):
+        if self._use_status_cache():
+            statuses = await self._get_cached_statuses()
+            return [{"facility_id": f_id, "status": status} for f_id, status in statuses.items()]
+
         statuses = await self.facility_repo.get_all_facility_statuses()
         return statuses
@@ -1,12 +1,20 @@
-from fastapi import HTTPException, Request
+import csv
+import io
+import json
+
+from fastapi import HTTPException, Request, UploadFile
 from jose import jwt, JWTError
+from pydantic import ValidationError
 from datetime import datetime, timedelta, date
 
+from cache.member_index import MemberIndex
+from cache.name_trie import NameTrie
 from database.repository.user_repository import UserRepository
 from core.config import settings
 from database.orm import User
-from schema.request import SignUpRequest, LogInRequest, ConfirmPhoneRequest
+from schema.request import SignUpRequest, LogInRequest, ConfirmPhoneRequest, CheckInSyncRequest
 from schema.response import JWTResponse
+from util.pagination import encode_cursor, decode_cursor
 
 
 class UserService:
@@ -15,9 +23,17 @@ class UserService:
     secret_key = settings.JWT_SECRET_KEY.get_secret_value()
     jwt_algorithm = "HS256"
 
-    def __init__(self, user_repo: UserRepository, visit_repo):
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        visit_repo,
+        member_index: MemberIndex | None = None,
+        name_trie: NameTrie | None = None
+    ):
         self.user_repo = user_repo
         self.visit_repo = visit_repo
+        self.member_index = member_index
+        self.name_trie = name_trie
 
     def create_jwt(self, member_id: str) -> str:
         return jwt.encode(
@@ -72,7 +88,17 @@ class UserService:
 
     async def sign_up(self, request: SignUpRequest):
         try:
-            if await self.user_repo.get_user_by_phone_num(request.phone_num):
+            user = User.create(
+                member_id=request.member_id,
+                name=request.name,
+                gender=request.gender,
+                birth=request.birth,
+                phone_num=request.phone_num
+            )
+
+            # 사전 조회 없이 유니크 제약으로 중복 판단
+            conflict = await self.user_repo.create_user(user)
+            if conflict == "phone_num":
                 raise HTTPException(
                     status_code=409,
                     detail={
@@ -80,7 +106,7 @@ class UserService:
                         "message": "이미 사용 중인 전화번호입니다"
                     }
                 )
-            if await self.user_repo.get_user_by_memberid(request.member_id):
+            if conflict == "member_id":
                 raise HTTPException(
                     status_code=409,
                     detail={
@@ -89,15 +115,10 @@ class UserService:
                     }
                 )
 
-            user = User.create(
-                member_id=request.member_id,
-                name=request.name,
-                gender=request.gender,
-                birth=request.birth,
-                phone_num=request.phone_num
-            )
-
-            await self.user_repo.save_user(user)
+            if self.member_index:
+                self.member_index.add(user.member_id, user.name, user.birth, user.phone_num)
+            if self.name_trie:
+                self.name_trie.add(user.member_id, user.name, user.birth)
 
             return {"message": "회원가입이 완료되었습니다"}
 
@@ -113,64 +134,185 @@ class UserService:
                 }
             )
 
+    IMPORT_ERROR_MESSAGES = {
+        "PHONE_NUM_CONFLICT": "이미 사용 중인 전화번호입니다",
+        "MEMBER_ID_CONFLICT": "이미 사용 중인 고유번호입니다",
+        "CONFLICT": "다른 요청에서 먼저 등록되었습니다",
+    }
+
+    @staticmethod
+    def _parse_import_file(file: UploadFile, content: str) -> list[tuple[int, dict | None, str | None]]:
+        """CSV(헤더 필수) 또는 JSONL 파싱 → (행 번호, 값, 파싱 오류) 목록"""
+        filename = (file.filename or "").lower()
+        is_jsonl = filename.endswith((".jsonl", ".ndjson")) or file.content_type in (
+            "application/jsonl", "application/x-ndjson"
+        )
+
+        rows = []
+        if is_jsonl:
+            for line_no, line in enumerate(content.splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    value = json.loads(line)
+                except ValueError as e:
+                    rows.append((line_no, None, f"JSON 형식 오류: {e}"))
+                    continue
+                if not isinstance(value, dict):
+                    rows.append((line_no, None, "각 줄은 JSON 객체여야 합니다"))
+                    continue
+                rows.append((line_no, value, None))
+        else:
+            reader = csv.DictReader(io.StringIO(content))
+            for row in reader:
+                # 헤더가 1행이므로 데이터는 2행부터
+                # 필드가 모자라면 값이 None, 남으면 None 키 아래에 모임
+                if None in row or None in row.values():
+                    rows.append((reader.line_num, None, "열 개수가 헤더와 다릅니다"))
+                    continue
+                rows.append((reader.line_num, {k.strip(): v.strip() for k, v in row.items() if k}, None))
+        return rows
+
+    async def import_users(self, file: UploadFile):
+        """회원 일괄 등록 - 행마다 SignUpRequest 로 검증 후 COPY 로 한 번에 적재"""
+        try:
+            content = (await file.read()).decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "INVALID_FILE", "message": "UTF-8 CSV 또는 JSONL 파일이어야 합니다"}
+            )
+
+        rows = self._parse_import_file(file, content)
+        if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail={
+                    "code": "TOO_MANY_ROWS",
+                    "message": f"한 번에 최대 {settings.USER_IMPORT_MAX_ROWS}명까지 등록할 수 있습니다"
+                }
+            )
+
+        errors = []
+        records = []
+        requests: dict[int, SignUpRequest] = {}
+        seen_member_ids, seen_phones = set(), set()
+        for row_no, value, parse_error in rows:
+            if parse_error:
+                errors.append({"row": row_no, "code": "INVALID_ROW", "message": parse_error})
+                continue
+            try:
+                request = SignUpRequest(**value)
+            except ValidationError as e:
+                message = ", ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                errors.append({"row": row_no, "code": "INVALID_ROW", "message": message})
+                continue
+
+            if len(request.member_id) > User.member_id.type.length:
+                errors.append({"row": row_no, "code": "INVALID_ROW", "message": "고유번호는 6자리입니다"})
+                continue
+            # 파일 안에서 중복된 행은 먼저 나온 행만 등록
+            if request.phone_num in seen_phones:
+                errors.append({"row": row_no, "member_id": request.member_id, "code": "PHONE_NUM_CONFLICT",
+                               "message": "파일 안에 같은 전화번호가 있습니다"})
+                continue
+            if request.member_id in seen_member_ids:
+                errors.append({"row": row_no, "member_id": request.member_id, "code": "MEMBER_ID_CONFLICT",
+                               "message": "파일 안에 같은 고유번호가 있습니다"})
+                continue
+            seen_phones.add(request.phone_num)
+            seen_member_ids.add(request.member_id)
+
+            requests[row_no] = request
+            records.append((
+                row_no, request.member_id, request.name, request.gender,
+                request.birth, User.calculate_age(request.birth), request.phone_num
+            ))
+
+        inserted = []
+        if records:
+            try:
+                inserted, conflicts = await self.user_repo.bulk_import_users(records)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": f"예기치 못한 오류 발생: {str(e)}"
+                    }
+                )
+
+            for row_no, code in conflicts.items():
+                errors.append({"row": row_no, "member_id": requests[row_no].member_id, "code": code,
+                               "message": self.IMPORT_ERROR_MESSAGES[code]})
+
+            for row_no in inserted:
+                request = requests[row_no]
+                if self.member_index:
+                    self.member_index.add(request.member_id, request.name, request.birth, request.phone_num)
+                if self.name_trie:
+                    self.name_trie.add(request.member_id, request.name, request.birth)
+
+        errors.sort(key=lambda e: e["row"])
+        return {
+            "total": len(rows),
+            "inserted": len(inserted),
+            "failed": len(errors),
+            "errors": errors
+        }
+
     async def log_in(self, request: LogInRequest, req: Request):
         try:
-            result = await self.find_users_with_name_and_birth(
+            # ✅ 인덱스와 오늘 방문 캐시로 이미 방문한 것이 확인되면 DB 를 거치지 않음
+            members = self._get_indexed_members(request.name, request.birth)
+            if members and self.visit_repo.has_cached_visit_today([m["member_id"] for m in members]):
+                multiple = len(members) > 1
+                return {
+                    "multiple": multiple,
+                    "phone_numbers": [m["phone"] for m in members] if multiple else [],
+                    "visit_log": True
+                }
+
+            # ✅ 회원 조회 + 하루 방문 체크 + 방문 등록을 한 번에
+            rows = await self.visit_repo.check_in_by_name_and_birth(
                 name=request.name,
-                birth=request.birth
+                birth=request.birth,
+                enforce_daily_limit=True
             )
 
-            if not result:
+            if not rows:
                 raise HTTPException(
                     status_code=404,
                     detail={
                         "code": "USER_NOT_FOUND",
-                        "message": "해당 이름과 생년으로 사용자를 찾을 수 없습니다."
+                        "message": "해당 이름과 생년월일의 사용자가 없습니다."
                     }
                 )
 
-            member_ids = []
-            if result.get("multiple"):
-                member_ids = [c["member_id"] for c in result.get("candidates", [])]
-            elif result.get("user"):
-                member_ids = [result["user"]["member_id"]]
+            multiple = len(rows) > 1
+            phone_numbers = [r.phone_num for r in rows]
 
-            # ✅ 하루 방문 체크
-            already_visited_today = await self.visit_repo.has_any_visit_today(member_ids)
-            if already_visited_today:
+            if any(r.visited_today for r in rows):
                 return {
-                    "multiple": result.get("multiple", False),
-                    "phone_numbers": [c["phone"] for c in result.get("candidates", [])] if result.get(
-                        "multiple") else [],
+                    "multiple": multiple,
+                    "phone_numbers": phone_numbers if multiple else [],
                     "visit_log": True
                 }
 
             # ✅ 동명이인 케이스 먼저 체크
-            if result.get("multiple"):
-                phone_numbers = [c["phone"] for c in result.get("candidates", [])]
+            if multiple:
                 return {
                     "multiple": True,
                     "phone_numbers": phone_numbers,
                     "message": "첫 로그인 - 방문 등록 전 단계"
                 }
 
-            # ✅ 한 명만 있는 경우 처리
-            user = result.get("user")
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail={
-                        "code": "USER_NOT_FOUND",
-                        "message": "사용자 정보가 없습니다."
-                    }
-                )
-
-            await self.visit_repo.add_visit(user["member_id"])
-
-            access_token = self.create_jwt(user["member_id"])
+            # ✅ 한 명만 있는 경우 - 방문은 이미 등록됨
+            user = rows[0]
+            access_token = self.create_jwt(user.member_id)
             return {
                 "access_token": access_token,
-                "name": user["name"],
+                "name": user.name,
                 "message": "로그인 성공 및 방문 등록 완료"
             }
 
@@ -209,52 +351,43 @@ class UserService:
 
     async def check_in(self, request: LogInRequest, req: Request):
         try:
-            result = await self.find_users_with_name_and_birth(
+            # ✅ 인덱스로 동명이인이 확인되면 DB 를 거치지 않음 (방문 등록 없이 전화번호만 반환)
+            members = self._get_indexed_members(request.name, request.birth)
+            if len(members) > 1:
+                return {
+                    "multiple": True,
+                    "phone_numbers": [m["phone"] for m in members]
+                }
+
+            # ✅ 회원 조회 + 방문 등록(제한 없이)을 한 번에, 동명이인이면 등록하지 않음
+            rows = await self.visit_repo.check_in_by_name_and_birth(
                 name=request.name,
-                birth=request.birth
+                birth=request.birth,
+                enforce_daily_limit=False
             )
 
-            if not result:
+            if not rows:
                 raise HTTPException(
                     status_code=404,
                     detail={
                         "code": "USER_NOT_FOUND",
-                        "message": "해당 이름과 생년으로 사용자를 찾을 수 없습니다."
+                        "message": "해당 이름과 생년월일의 사용자가 없습니다."
                     }
                 )
 
-            member_ids = []
-            if result.get("multiple"):
-                member_ids = [c["member_id"] for c in result.get("candidates", [])]
-            elif result.get("user"):
-                member_ids = [result["user"]["member_id"]]
-
             # ✅ 동명이인 케이스: 첫 로그인 여부나 방문 체크 없이 전화번호만 반환
-            if result.get("multiple"):
-                phone_numbers = [c["phone"] for c in result.get("candidates", [])]
+            if len(rows) > 1:
                 return {
                     "multiple": True,
-                    "phone_numbers": phone_numbers
+                    "phone_numbers": [r.phone_num for r in rows]
                 }
 
-            # ✅ 한 명만 있는 경우 처리
-            user = result.get("user")
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail={
-                        "code": "USER_NOT_FOUND",
-                        "message": "사용자 정보가 없습니다."
-                    }
-                )
-
-            # ✅ 방문 등록 (제한 없이)
-            await self.visit_repo.add_visit(user["member_id"])
-
-            access_token = self.create_jwt(user["member_id"])
+            # ✅ 한 명만 있는 경우 - 방문은 이미 등록됨
+            user = rows[0]
+            access_token = self.create_jwt(user.member_id)
             return {
                 "access_token": access_token,
-                "name": user["name"],
+                "name": user.name,
                 "message": "로그인 성공 및 방문 등록 완료"
             }
 
@@ -269,10 +402,112 @@ class UserService:
                 }
             )
 
-    async def find_users_with_name_and_birth(self, name: str, birth: date):
-        users = await self.user_repo.get_user_by_name_and_birth(name=name, birth=birth)
+    @staticmethod
+    def _resolve_offline_member(members: list[dict], phone: str | None) -> tuple[str | None, str | None]:
+        """오프라인 방문 기록의 회원 확인 → (member_id, 실패 상태)"""
+        if phone:
+            members = [m for m in members if m["phone"] == phone]
+        if not members:
+            return None, "not_found"
+        if len(members) > 1:
+            return None, "ambiguous"
+        return members[0]["member_id"], None
+
+    async def sync_check_ins(self, request: CheckInSyncRequest):
+        """키오스크가 오프라인 동안 쌓아둔 방문 기록 일괄 동기화
+
+        회원은 member_id 목록과 (이름, 생년월일) 목록으로 한 번씩만 조회하고,
+        방문 기록은 키오스크의 visit_time 그대로 다중 행 INSERT 한 번으로 저장한다.
+        이미 입장한 방문이므로 하루 1회 제한은 적용하지 않는다.
+        """
+        check_ins = request.check_ins
+        if len(check_ins) > settings.CHECK_IN_SYNC_MAX_ITEMS:
+            raise HTTPException(
+                status_code=413,
+                detail={
+                    "code": "TOO_MANY_CHECK_INS",
+                    "message": f"한 번에 최대 {settings.CHECK_IN_SYNC_MAX_ITEMS}건까지 동기화할 수 있습니다"
+                }
+            )
+
+        results = [{"idempotency_key": item.idempotency_key} for item in check_ins]
+        pending = []
+        seen_keys = set()
+        for result, item in zip(results, check_ins):
+            # 같은 요청 안에서 반복된 키는 처음 것만 저장
+            if item.idempotency_key in seen_keys:
+                result["status"] = "duplicate"
+                continue
+            seen_keys.add(item.idempotency_key)
+
+            if not item.member_id and not (item.name and item.birth):
+                result["status"] = "invalid"
+                result["message"] = "member_id 또는 name, birth 가 필요합니다"
+                continue
+            pending.append((result, item))
+
+        visits = []
+        try:
+            member_ids = list({item.member_id for _, item in pending if item.member_id})
+            known_ids = {u.member_id for u in await self.user_repo.get_users_by_member_ids(member_ids)}
+            members_by_key = await self._get_members_by_name_and_birth_pairs(
+                [(item.name, item.birth) for _, item in pending if not item.member_id]
+            )
+
+            for result, item in pending:
+                if item.member_id:
+                    member_id = item.member_id if item.member_id in known_ids else None
+                    status = None if member_id else "not_found"
+                else:
+                    member_id, status = self._resolve_offline_member(
+                        members_by_key[(item.name, item.birth)], item.phone
+                    )
+                if status:
+                    result["status"] = status
+                    continue
+
+                result["member_id"] = member_id
+                visits.append({
+                    "user_id": member_id,
+                    # 시간대가 없으면 서버 로컬 시각으로 간주
+                    "visit_time": item.visit_time if item.visit_time.tzinfo else item.visit_time.astimezone(),
+                    "idempotency_key": item.idempotency_key
+                })
+
+            inserted = await self.visit_repo.add_synced_visits(visits)
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "code": "INTERNAL_SERVER_ERROR",
+                    "message": f"예기치 못한 오류 발생: {str(e)}"
+                }
+            )
+
+        # 이전 동기화에서 이미 저장된 키는 duplicate
+        for result, item in pending:
+            if "member_id" in result:
+                result["status"] = "created" if item.idempotency_key in inserted else "duplicate"
+
+        return {
+            "total": len(check_ins),
+            "created": len(inserted),
+            "results": results
+        }
+
+    @staticmethod
+    def _to_member(user: User) -> dict:
+        return {
+            "member_id": user.member_id,
+            "name": user.name,
+            "birth": user.birth,
+            "phone": user.phone_num
+        }
 
-        if not users:
+    @staticmethod
+    def _build_lookup_result(members: list[dict]) -> dict:
+        if not members:
             raise HTTPException(
                 status_code=404,
                 detail={
@@ -282,33 +517,96 @@ class UserService:
             )
 
         # 2명 이상 → 후보 리스트(candidates) 반환
-        if len(users) > 1:
+        if len(members) > 1:
             return {
                 "multiple": True,
-                "candidates": [
-                    {
-                        "member_id": u.member_id,
-                        "name": u.name,
-                        "birth": u.birth,
-                        "phone": u.phone_num
-                    }
-                    for u in users
-                ]
+                "candidates": members
             }
 
         # 1명 → 단일 유저 반환
-        user = users[0]
         return {
             "multiple": False,
-            "user": {
-                "member_id": user.member_id,
-                "name": user.name,
-                "birth": user.birth,
-                "phone": user.phone_num
-            }
+            "user": members[0]
         }
 
+    def _use_member_index(self) -> bool:
+        return self.member_index is not None and self.member_index.usable
+
+    def _get_indexed_members(self, name: str, birth: date) -> list[dict]:
+        """인덱스를 쓸 수 있으면 인덱스의 회원 목록, 아니면 빈 목록 (없으면 DB 확인 필요)"""
+        if not self._use_member_index():
+            return []
+        return self.member_index.get(name, birth)
+
+    async def _get_members_with_name_and_birth(self, name: str, birth: date) -> list[dict]:
+        """인덱스에 있으면 DB를 거치지 않고, 없으면 DB 조회 후 인덱스에 채움"""
+        use_index = self._use_member_index()
+
+        if use_index:
+            members = self.member_index.get(name, birth)
+            if members:
+                return members
+
+        users = await self.user_repo.get_user_by_name_and_birth(name=name, birth=birth)
+        members = [self._to_member(u) for u in users]
+
+        if use_index:
+            for m in members:
+                self.member_index.add(m["member_id"], m["name"], m["birth"], m["phone"])
+
+        return members
+
+    async def find_users_with_name_and_birth(self, name: str, birth: date):
+        members = await self._get_members_with_name_and_birth(name=name, birth=birth)
+        return self._build_lookup_result(members)
+
+    async def _get_members_by_name_and_birth_pairs(self, pairs: list[tuple[str, date]]) -> dict:
+        """여러 (이름, 생년월일)을 한 번에 조회
+
+        인덱스에 없는 쌍만 모아 한 번의 쿼리로 조회하고, (name, birth) → 회원 목록을 반환
+        """
+        keys = list(dict.fromkeys(pairs))
+        members_by_key: dict[tuple[str, date], list[dict]] = {key: [] for key in keys}
+        use_index = self._use_member_index()
+
+        missing = keys
+        if use_index:
+            missing = []
+            for name, birth in keys:
+                members = self.member_index.get(name, birth)
+                if members:
+                    members_by_key[(name, birth)] = members
+                else:
+                    missing.append((name, birth))
+
+        if missing:
+            users = await self.user_repo.get_users_by_name_and_birth_pairs(missing)
+            for u in users:
+                key = (u.name, u.birth)
+                if key not in members_by_key:
+                    continue
+                members_by_key[key].append(self._to_member(u))
+                if use_index:
+                    self.member_index.add(u.member_id, u.name, u.birth, u.phone_num)
+
+        return members_by_key
+
+    async def find_users_with_name_and_birth_bulk(self, pairs: list[tuple[str, date]]) -> dict:
+        """(name, birth) → find_users_with_name_and_birth 와 같은 형태의 결과"""
+        members_by_key = await self._get_members_by_name_and_birth_pairs(pairs)
+        return {key: self._build_lookup_result(members) for key, members in members_by_key.items()}
+
     async def find_user_with_name_birth_phone(self, name: str, birth: date, phone: str):
+        if self._use_member_index():
+            for m in self.member_index.get(name, birth):
+                if m["phone"] == phone:
+                    return {
+                        "member_id": m["member_id"],
+                        "name": m["name"],
+                        "birth": m["birth"],
+                        "phone_num": m["phone"]
+                    }
+
         user = await self.user_repo.get_user_by_name_birth_phone(name, birth, phone)
 
         if not user:
@@ -321,17 +619,65 @@ class UserService:
             "phone_num": user.phone_num
         }
 
+    @staticmethod
+    def _to_user_detail(u: User) -> dict:
+        return {
+            "member_id": u.member_id,
+            "name": u.name,
+            "gender": u.gender,
+            "birth": u.birth,
+            "age": u.age,
+            "phone_num": u.phone_num,
+            "created_at": u.created_at
+        }
+
     async def get_all_users(self, skip: int = 0, limit: int = 100, name: str | None = None):
+        """OFFSET 방식 (deprecated, get_users_page 사용)"""
         users = await self.user_repo.get_all_users(skip=skip, limit=limit, name=name)
-        return [
-            {
-                "member_id": u.member_id,
-                "name": u.name,
-                "gender": u.gender,
-                "birth": u.birth,
-                "age": u.age,
-                "phone_num": u.phone_num,
-                "created_at": u.created_at
-            }
-            for u in users
-        ]
\ No newline at end of file
+        return [self._to_user_detail(u) for u in users]
+
+    def autocomplete_names(self, query: str, limit: int):
+        """키오스크 이름 입력 자동완성 (초성/자모 단위, DB 조회 없음)"""
+        if self.name_trie is None or not self.name_trie.loaded:
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "code": "AUTOCOMPLETE_UNAVAILABLE",
+                    "message": "이름 자동완성을 사용할 수 없습니다."
+                }
+            )
+        return {"candidates": self.name_trie.search(query, limit)}
+
+    async def search_users_by_name(self, query: str, limit: int, mode: str = "auto"):
+        if mode == "prefix":
+            users = await self.user_repo.search_users_by_name(query, limit=limit, prefix=True)
+        elif mode == "auto" and len(query) < 3:
+            # 3글자 미만은 트라이그램이 만들어지지 않아 인덱스를 못 타므로 앞부분 검색을 먼저 하고,
+            # 모자라면 부분 일치로 채움 ("미숙" → "김미숙")
+            users = await self.user_repo.search_users_by_name(query, limit=limit, prefix=True)
+            if len(users) < limit:
+                found = {u.member_id for u in users}
+                more = await self.user_repo.search_users_by_name(query, limit=limit)
+                users += [u for u in more if u.member_id not in found][:limit - len(users)]
+        else:
+            users = await self.user_repo.search_users_by_name(query, limit=limit)
+        return [self._to_user_detail(u) for u in users]
+
+    async def get_users_page(self, limit: int, cursor: str | None = None, name: str | None = None):
+        after_member_id = None
+        if cursor:
+            (after_member_id,) = decode_cursor(cursor, 1)
+            if not isinstance(after_member_id, str):
+                raise HTTPException(
+                    status_code=400,
+                    detail={"code": "INVALID_CURSOR", "message": "잘못된 커서입니다."}
+                )
+
+        users = await self.user_repo.get_users_page(limit=limit, after_member_id=after_member_id, name=name)
+        has_next = len(users) > limit
+        users = users[:limit]
+
+        return {
+            "items": [self._to_user_detail(u) for u in users],
+            "next_cursor": encode_cursor(users[-1].member_id) if has_next else None
+        }
@@ -0,0 +1,151 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# ------------------- SQL 지문 -------------------
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_CAST = re.compile(r"::[A-Za-z_]+(?:\[\])?")
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+# IN (?, ?, ?) / IN ((?, ?), (?, ?)) / VALUES (?, ?), (?, ?) 는 개수와 무관하게 하나로
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\([^()]*\)(?:\s*,\s*\([^()]*\))*", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """값만 다른 SQL 이 같은 문자열이 되도록 정규화
+
+    "SELECT ... WHERE users.member_id = $1" 과 "... = $2", IN 목록 길이가 다른 쿼리 등을 한 종류로 본다.
+    """
+    sql = _STRING.sub("?", statement)
+    sql = _CAST.sub("", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (?)", sql)
+    sql = _VALUES_LIST.sub("VALUES (?)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+# ------------------- 쿼리 기록 -------------------
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryLog:
+    """요청(또는 테스트 구간) 하나에서 실행된 쿼리 수와 지문별 횟수
+
+    budget 을 넘는 쿼리가 실행되려 하면 raise_on_exceed 일 때 QueryBudgetExceeded 를 던진다.
+    """
+
+    def __init__(self, budget: int | None = None, raise_on_exceed: bool = False):
+        self.budget = budget
+        self.raise_on_exceed = raise_on_exceed
+        self.queries = 0
+        self.fingerprints: Counter[str] = Counter()
+
+    def record(self, statement: str):
+        if self.raise_on_exceed and self.budget is not None and self.queries >= self.budget:
+            raise QueryBudgetExceeded(f"쿼리 예산 초과: {self.budget}회를 넘는 쿼리\n{self.report()}")
+        self.queries += 1
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold 회 이상 반복된 쿼리 (N+1 의심)"""
+        return [(sql, count) for sql, count in self.fingerprints.most_common() if count >= threshold]
+
+    def report(self, limit: int = 5) -> str:
+        lines = [f"쿼리 {self.queries}회 (지문 {len(self.fingerprints)}종)"]
+        for sql, count in self.fingerprints.most_common(limit):
+            lines.append(f"  {count}회: {sql[:200]}")
+        return "\n".join(lines)
+
+
+_query_log: ContextVar[QueryLog | None] = ContextVar("query_log", default=None)
+# 테스트 등에서 요청 컨텍스트와 무관하게 모든 쿼리를 모을 때 사용 (TestClient 는 앱을 다른 스레드에서 실행)
+_captures: list[QueryLog] = []
+
+
+def install_query_log(engine):
+    """실행되는 SQL 을 현재 요청의 QueryLog 에 기록 (기록 중이 아니면 아무것도 하지 않음)"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        log = _query_log.get()
+        if log is not None:
+            log.record(statement)
+        for capture in _captures:
+            capture.record(statement)
+
+
+@contextmanager
+def capture_queries(budget: int | None = None, raise_on_exceed: bool = False):
+    """구간 안에서 실행된 모든 쿼리 기록
+
+        with capture_queries() as log:
+            client.post("/users/log-in", json=...)
+        log.queries
+    """
+    log = QueryLog(budget, raise_on_exceed)
+    _captures.append(log)
+    try:
+        yield log
+    finally:
+        _captures.remove(log)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, max_repeats: int | None = None):
+    """구간 안의 쿼리 수가 max_queries 이하, 같은 쿼리 반복이 max_repeats 이하인지 검사"""
+    with capture_queries() as log:
+        yield log
+    assert log.queries <= max_queries, f"쿼리 예산 {max_queries}회 초과\n{log.report()}"
+    if max_repeats is not None:
+        repeated = log.repeated(max_repeats + 1)
+        assert not repeated, f"같은 쿼리가 {max_repeats}회 넘게 반복됨 (N+1 의심)\n{log.report()}"
+
+
+# ------------------- 요청별 검사 -------------------
+class QueryBudgetMiddleware:
+    """개발/스테이징용 - 요청마다 쿼리 수를 세어 예산 초과나 반복 쿼리(N+1 의심)를 출력
+
+    raise_on_exceed 이면 예산을 넘는 쿼리를 실행하기 전에 QueryBudgetExceeded 를 던져 500 으로 끝낸다.
+    """
+
+    def __init__(self, app: ASGIApp, budget: int, repeat_threshold: int, raise_on_exceed: bool = False):
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+        self.raise_on_exceed = raise_on_exceed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog(self.budget, self.raise_on_exceed)
+        token = _query_log.set(log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_log.reset(token)
+            self._check(scope, log)
+
+    def _check(self, scope: Scope, log: QueryLog):
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        over_budget = log.queries > self.budget
+        repeated = log.repeated(self.repeat_threshold)
+        if not over_budget and not repeated:
+            return
+
+        reasons = []
+        if over_budget:
+            reasons.append(f"예산 {self.budget}회 초과")
+        if repeated:
+            reasons.append(f"같은 쿼리 {repeated[0][1]}회 반복 (N+1 의심)")
+        print(f"[쿼리 검사] {scope['method']} {route}: {', '.join(reasons)}\n{log.report()}")
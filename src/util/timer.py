@@ -0,0 +1,186 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from util.metrics import Histogram, registry
+
+
+class Timer:
+    """경과 시간 측정 - 컨텍스트 매니저/데코레이터
+
+        with Timer() as t:
+            ...
+        t.elapsed_ms
+
+        @Timer(S3_REQUEST_SECONDS, operation="upload")
+        async def upload(...): ...
+
+    histogram 을 넘기면 끝날 때 경과 시간(초)을 labels 와 함께 기록한다.
+    """
+
+    def __init__(self, histogram: Histogram | None = None, **labels):
+        self.histogram = histogram
+        self.labels = labels
+        self.started: float | None = None
+        self.elapsed: float = 0.0
+
+    @property
+    def elapsed_ms(self) -> float:
+        return round(self.elapsed * 1000, 1)
+
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.started
+        if self.histogram is not None:
+            self.histogram.observe(self.elapsed, **self.labels)
+
+    async def __aenter__(self) -> "Timer":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__exit__(exc_type, exc, tb)
+
+    def __call__(self, fn):
+        # 호출마다 새 Timer 를 써서 동시에 실행되어도 섞이지 않도록
+        if asyncio.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with Timer(self.histogram, **self.labels):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with Timer(self.histogram, **self.labels):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+# ------------------- 요청별 DB 사용량 -------------------
+class RequestStats:
+    """요청 하나에서 실행된 쿼리 수와 DB 시간"""
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_seconds",
+    "SQL 한 건 실행 시간",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+_QUERY_STARTED = "timer_query_started"
+
+
+def instrument_engine(engine):
+    """before/after_cursor_execute 로 쿼리 시간을 재서 현재 요청에 합산
+
+    AsyncEngine 이면 sync_engine 에 등록한다. asyncpg 호출은 요청 태스크의 컨텍스트에서
+    실행되므로 ContextVar 로 요청을 구분할 수 있다.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _record_query(conn)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        # 실패한 쿼리도 시간은 기록 (after_cursor_execute 가 호출되지 않음)
+        if exception_context.connection is not None and exception_context.cursor is not None:
+            _record_query(exception_context.connection)
+
+
+def _record_query(conn):
+    started = conn.info.get(_QUERY_STARTED)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    DB_QUERY_SECONDS.observe(elapsed)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+# ------------------- 요청별 응답 시간 -------------------
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간 (응답 전송 완료까지)",
+    labelnames=("method", "route", "status")
+)
+HTTP_REQUEST_DB_QUERIES = registry.histogram(
+    "http_request_db_queries",
+    "요청 하나에서 실행된 쿼리 수",
+    labelnames=("method", "route"),
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50, 100)
+)
+HTTP_REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_seconds",
+    "요청 하나에서 쿼리 실행에 쓴 시간 합계",
+    labelnames=("method", "route")
+)
+
+# 수집 자체는 기록하지 않음
+EXCLUDED_PATHS = ("/metrics",)
+
+
+class TimingMiddleware:
+    """라우트별 응답 시간, 쿼리 수, DB 시간 기록
+
+    라벨은 실제 경로가 아니라 라우트 경로(/board/{board_id})를 쓰고,
+    일치하는 라우트가 없으면 "unmatched" 로 묶는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        timer = Timer()
+        try:
+            with timer:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.observe(timer.elapsed, method=method, route=route_path, status=status_code)
+            HTTP_REQUEST_DB_QUERIES.observe(stats.queries, method=method, route=route_path)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.db_seconds, method=method, route=route_path)
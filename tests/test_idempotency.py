@@ -0,0 +1,117 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+import core.idempotency as idempotency
+from cache.idempotency_cache import IdempotencyCache
+from core.config import settings
+
+
+class FakeRecord:
+    def __init__(self, request_hash):
+        self.request_hash = request_hash
+        self.status_code = None
+        self.headers = None
+        self.body = None
+
+
+class FakeStore:
+    """idempotency_record 테이블 대신 (워커 간 공유 저장소 역할)"""
+
+    def __init__(self):
+        self.records: dict[str, FakeRecord] = {}
+        self.extended: list[str] = []
+
+
+def _fake_repository(store: FakeStore):
+    class FakeIdempotencyRepository:
+        def __init__(self, session):
+            pass
+
+        async def claim(self, key, request_hash, lock_seconds):
+            if key in store.records:
+                return False, store.records[key]
+            store.records[key] = FakeRecord(request_hash)
+            return True, None
+
+        async def extend_claim(self, key, lock_seconds):
+            store.extended.append(key)
+
+        async def complete(self, key, status_code, headers, body, ttl_seconds):
+            record = store.records[key]
+            record.status_code, record.headers, record.body = status_code, headers, body
+
+        async def release(self, key):
+            store.records.pop(key, None)
+
+    return FakeIdempotencyRepository
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield None
+
+
+def _client(monkeypatch, store: FakeStore, handler_delay: float = 0):
+    monkeypatch.setattr(idempotency, "IdempotencyRepository", _fake_repository(store))
+    monkeypatch.setattr(idempotency, "AsyncSessionLocal", _fake_session)
+
+    app = FastAPI()
+    calls = []
+
+    @app.post("/users/import")
+    async def import_users(file: UploadFile = File(...)):
+        calls.append(await file.read())
+        await asyncio.sleep(handler_delay)
+        return {"count": len(calls)}
+
+    @app.post("/users/sign-up")
+    async def sign_up(body: dict):
+        calls.append(body)
+        return {"count": len(calls)}
+
+    # 워커마다 캐시가 따로이므로 테스트마다 새 캐시
+    app.add_middleware(idempotency.IdempotencyMiddleware, cache=IdempotencyCache(100, 60))
+    return TestClient(app), calls
+
+
+def test_multipart_retry_with_new_boundary_is_replayed(monkeypatch):
+    client, calls = _client(monkeypatch, FakeStore())
+    headers = {"Idempotency-Key": "import-1"}
+    files = {"file": ("members.csv", b"member_id,name\n000001,kim\n", "text/csv")}
+
+    first = client.post("/users/import", files=files, headers=headers)
+    # requests/httpx 는 매번 새 boundary 를 만든다
+    retry = client.post("/users/import", files=files, headers=headers)
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json() == {"count": 1}
+    assert retry.headers[idempotency.REPLAYED_HEADER] == "true"
+    assert len(calls) == 1
+
+
+def test_json_body_mismatch_is_rejected(monkeypatch):
+    client, calls = _client(monkeypatch, FakeStore())
+    headers = {"Idempotency-Key": "sign-up-1"}
+
+    assert client.post("/users/sign-up", json={"name": "a"}, headers=headers).status_code == 200
+    response = client.post("/users/sign-up", json={"name": "b"}, headers=headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "IDEMPOTENCY_KEY_MISMATCH"
+    assert len(calls) == 1
+
+
+def test_claim_is_extended_while_request_runs(monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_SECONDS", 0.1)
+    store = FakeStore()
+    client, _ = _client(monkeypatch, store, handler_delay=0.3)
+
+    response = client.post(
+        "/users/import", files={"file": ("a.csv", b"x", "text/csv")}, headers={"Idempotency-Key": "slow"}
+    )
+
+    assert response.status_code == 200
+    assert store.extended and set(store.extended) == {"slow"}
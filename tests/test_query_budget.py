@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from util.query_budget import (
+    QueryBudgetExceeded, QueryLog, assert_query_budget, capture_queries, fingerprint, install_query_log
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_log(engine)
+    yield engine
+    engine.dispose()
+
+
+def _run(engine, *statements):
+    with engine.connect() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+
+
+# ------------------- fingerprint -------------------
+def test_fingerprint_ignores_parameter_style_and_literals():
+    assert fingerprint("SELECT * FROM users WHERE users.member_id = $1") == \
+        fingerprint("SELECT * FROM users WHERE users.member_id = $2") == \
+        fingerprint("SELECT * FROM users WHERE users.member_id = '000001'") == \
+        fingerprint("SELECT  *\nFROM users WHERE users.member_id = %(member_id_1)s") == \
+        "SELECT * FROM users WHERE users.member_id = ?"
+
+
+def test_fingerprint_collapses_in_and_values_lists():
+    assert fingerprint("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == fingerprint("SELECT 1 FROM t WHERE id IN ($1)")
+    assert fingerprint("SELECT 1 FROM t WHERE (a, b) IN (($1, $2), ($3, $4))") == \
+        fingerprint("SELECT 1 FROM t WHERE (a, b) IN (($1, $2))")
+    assert fingerprint("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == \
+        fingerprint("INSERT INTO t (a, b) VALUES ($1, $2)")
+
+
+def test_fingerprint_strips_casts_and_numbers():
+    assert fingerprint("SELECT $1::VARCHAR LIMIT 20") == fingerprint("SELECT $2::INTEGER[] LIMIT 100") == "SELECT ? LIMIT ?"
+
+
+def test_fingerprint_keeps_different_queries_apart():
+    assert fingerprint("SELECT * FROM users WHERE name = $1") != fingerprint("SELECT * FROM users WHERE phone_num = $1")
+
+
+# ------------------- QueryLog -------------------
+def test_repeated_reports_queries_at_or_over_threshold():
+    log = QueryLog()
+    for member_id in ("000001", "000002", "000003"):
+        log.record(f"SELECT * FROM member_visit WHERE user_id = '{member_id}'")
+    log.record("SELECT * FROM users")
+
+    assert log.queries == 4
+    assert log.repeated(3) == [("SELECT * FROM member_visit WHERE user_id = ?", 3)]
+    assert log.repeated(4) == []
+
+
+def test_raise_on_exceed_stops_before_the_extra_query():
+    log = QueryLog(budget=1, raise_on_exceed=True)
+    log.record("SELECT 1")
+    with pytest.raises(QueryBudgetExceeded):
+        log.record("SELECT 2")
+    assert log.queries == 1
+
+
+# ------------------- 엔진 연동 -------------------
+def test_capture_queries_counts_statements(engine):
+    _run(engine, "SELECT 1")
+    with capture_queries() as log:
+        _run(engine, "SELECT 1", "SELECT 2")
+    _run(engine, "SELECT 3")
+
+    assert log.queries == 2
+
+
+def test_assert_query_budget_passes_within_budget(engine):
+    with assert_query_budget(2, max_repeats=1) as log:
+        _run(engine, "SELECT 1", "SELECT 1 WHERE 1 = 1")
+    assert log.queries == 2
+
+
+def test_assert_query_budget_fails_over_budget(engine):
+    with pytest.raises(AssertionError, match="쿼리 예산 1회 초과"):
+        with assert_query_budget(1):
+            _run(engine, "SELECT 1", "SELECT 2")
+
+
+def test_assert_query_budget_detects_n_plus_one(engine):
+    with pytest.raises(AssertionError, match="N\\+1"):
+        with assert_query_budget(10, max_repeats=2):
+            for member_id in ("000001", "000002", "000003"):
+                _run(engine, f"SELECT '{member_id}'")
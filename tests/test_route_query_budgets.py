@@ -0,0 +1,121 @@
+"""주요 라우트의 DB 왕복 수 고정 (conftest.ROUTE_QUERY_BUDGETS)
+
+    TEST_POSTGRES_DATABASE_URL=postgresql+asyncpg://user:pw@localhost/kiosk_test python -m pytest tests
+
+테스트 DB 에는 테이블이 만들어져 있어야 한다 (python -m database.synthetic --create-tables).
+모듈 시작 시 데이터를 모두 지우고 database/synthetic.py 로 다시 적재한다.
+"""
+import asyncio
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+
+import asyncpg
+import pytest
+from fastapi.testclient import TestClient
+
+from database.synthetic import SyntheticDataset, asyncpg_dsn, load_dataset
+
+TEST_DATABASE_URL = os.environ.get("TEST_POSTGRES_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_POSTGRES_DATABASE_URL 이 설정되지 않음")
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    dataset = SyntheticDataset(
+        members=500, seed=1, visit_days=14, visits_per_day=60, reservations=30, boards=60
+    )
+
+    async def load():
+        conn = await asyncpg.connect(asyncpg_dsn(TEST_DATABASE_URL))
+        try:
+            await load_dataset(conn, dataset, truncate=True)
+        finally:
+            await conn.close()
+
+    asyncio.run(load())
+    return dataset
+
+
+@pytest.fixture(scope="module")
+def members(dataset):
+    """(이름, 생년월일)이 한 명뿐인 회원을 하나씩 꺼내 씀 (오늘 방문/시설 이용 기록이 없는 상태)"""
+    rows = list(dataset.users())
+    counts = Counter((r[1], r[3]) for r in rows)
+    return iter([
+        {"member_id": r[0], "name": r[1], "birth": r[3].isoformat(), "phone": r[5]}
+        for r in rows if counts[(r[1], r[3])] == 1
+    ])
+
+
+@pytest.fixture(scope="module")
+def client(dataset):
+    # 엔진이 TEST_POSTGRES_DATABASE_URL 로 만들어지도록 conftest 이후에 import
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_log_in(client, members, query_budget):
+    member = next(members)
+    with query_budget("POST /users/log-in"):
+        response = client.post("/users/log-in", json={"name": member["name"], "birth": member["birth"]})
+    assert response.status_code == 200
+
+
+def test_check_in(client, members, query_budget):
+    member = next(members)
+    with query_budget("POST /users/check-in"):
+        response = client.post("/users/check-in", json={"name": member["name"], "birth": member["birth"]})
+    assert response.status_code == 200
+
+
+def test_check_in_sync(client, members, query_budget):
+    visit_time = (datetime.now().astimezone() - timedelta(hours=1)).isoformat()
+    by_id, by_name, *rest = [next(members) for _ in range(6)]
+    check_ins = [
+        {"idempotency_key": "sync-1", "visit_time": visit_time, "member_id": by_id["member_id"]},
+        {"idempotency_key": "sync-2", "visit_time": visit_time, "name": by_name["name"], "birth": by_name["birth"]},
+        {"idempotency_key": "sync-3", "visit_time": visit_time, "member_id": "999999"},
+    ] + [
+        {"idempotency_key": f"sync-{i}", "visit_time": visit_time, "name": m["name"], "birth": m["birth"]}
+        for i, m in enumerate(rest, start=4)
+    ]
+
+    with query_budget("POST /users/check-in/sync", max_repeats=1):
+        response = client.post("/users/check-in/sync", json={"check_ins": check_ins})
+    assert response.status_code == 200
+
+
+def test_reserve(client, members, query_budget):
+    member = next(members)
+    with query_budget("POST /facility/reserve"):
+        response = client.post(
+            "/facility/reserve", json={"facility_id": 1, "name": member["name"], "birth": member["birth"]}
+        )
+    assert response.status_code == 201
+
+
+def test_multi_confirm(client, members, query_budget):
+    group = [next(members) for _ in range(4)]
+    with query_budget("POST /facility/multi-confirm", max_repeats=1):
+        response = client.post("/facility/multi-confirm", json={
+            "facility_id": 2,
+            "members": [{"name": m["name"], "birth": m["birth"], "phone": m["phone"]} for m in group]
+        })
+    assert response.status_code == 201
+
+
+def test_facility_statuses(client, query_budget):
+    with query_budget("GET /facility/facilities/status"):
+        response = client.get("/facility/facilities/status")
+    assert response.status_code == 200
+
+
+def test_board_pages(client, query_budget):
+    first = client.get("/board", params={"size": 20}).json()
+    with query_budget("GET /board", max_repeats=1):
+        response = client.get("/board", params={"size": 20, "cursor": first["next_cursor"]})
+    assert response.status_code == 200
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import date
+
+from cache.member_index import MemberIndex
+from cache.visit_cache import TodayVisitCache
+from database.repository.visit_repository import MemberVisitRepository
+from schema.request import LogInRequest
+from service.user_service import UserService
+
+BIRTH = date(1950, 3, 1)
+
+
+class FakeVisitRepository(MemberVisitRepository):
+    """CTE 경로를 타면 호출 인자를 기록하고 빈 결과(회원 없음)를 반환"""
+
+    def __init__(self, visit_cache: TodayVisitCache | None = None):
+        super().__init__(None, visit_cache)
+        self.cte_calls = []
+
+    async def check_in_by_name_and_birth(self, name, birth, enforce_daily_limit):
+        self.cte_calls.append((name, birth, enforce_daily_limit))
+        return []
+
+
+def _index(*members) -> MemberIndex:
+    index = MemberIndex()
+    index.set_active(True)
+    index.begin_load()
+    index.load(members)
+    return index
+
+
+def _service(index: MemberIndex, visited: list[str]):
+    cache = TodayVisitCache()
+    cache.load(visited)
+    visit_repo = FakeVisitRepository(cache)
+    return UserService(None, visit_repo, index), visit_repo
+
+
+def _call(method):
+    try:
+        return asyncio.run(method(LogInRequest(name="김영숙", birth=BIRTH), None))
+    except Exception as e:
+        return e
+
+
+def test_log_in_already_visited_answers_from_caches():
+    service, visit_repo = _service(_index(("000001", "김영숙", BIRTH, "01011112222")), visited=["000001"])
+    result = _call(service.log_in)
+    assert result == {"multiple": False, "phone_numbers": [], "visit_log": True}
+    assert visit_repo.cte_calls == []
+
+
+def test_log_in_not_yet_visited_uses_cte():
+    service, visit_repo = _service(_index(("000001", "김영숙", BIRTH, "01011112222")), visited=[])
+    _call(service.log_in)
+    assert visit_repo.cte_calls == [("김영숙", BIRTH, True)]
+
+
+def test_check_in_namesakes_answer_from_index():
+    index = _index(("000001", "김영숙", BIRTH, "01011112222"), ("000002", "김영숙", BIRTH, "01033334444"))
+    service, visit_repo = _service(index, visited=[])
+    result = _call(service.check_in)
+    assert result["multiple"] is True
+    assert sorted(result["phone_numbers"]) == ["01011112222", "01033334444"]
+    assert visit_repo.cte_calls == []
+
+
+def test_unusable_index_uses_cte():
+    index = _index(("000001", "김영숙", BIRTH, "01011112222"), ("000002", "김영숙", BIRTH, "01033334444"))
+    index.set_active(False)
+    service, visit_repo = _service(index, visited=["000001"])
+    _call(service.log_in)
+    _call(service.check_in)
+    assert visit_repo.cte_calls == [("김영숙", BIRTH, True), ("김영숙", BIRTH, False)]
@@ -0,0 +1,67 @@
+import asyncio
+import io
+
+from fastapi import UploadFile
+
+from service.user_service import UserService
+
+HEADER = "member_id,name,gender,birth,phone_num\n"
+
+
+class FakeUserRepository:
+    def __init__(self):
+        self.records = []
+
+    async def bulk_import_users(self, records):
+        self.records.extend(records)
+        return [r[0] for r in records], {}
+
+
+def _upload(content: str, filename: str = "members.csv") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content.encode()), filename=filename)
+
+
+def _import(content: str):
+    repo = FakeUserRepository()
+    result = asyncio.run(UserService(repo, None).import_users(_upload(content)))
+    return result, repo
+
+
+def test_parse_csv_rows():
+    rows = UserService._parse_import_file(_upload(""), HEADER + " 000001 , 김영숙 ,female,1950-03-01,01012345678\n")
+    assert rows == [(2, {
+        "member_id": "000001", "name": "김영숙", "gender": "female", "birth": "1950-03-01", "phone_num": "01012345678"
+    }, None)]
+
+
+def test_parse_csv_short_and_long_rows():
+    content = HEADER + "000001,김영숙\n000002,김영수,male,1950-03-01,01012345678,extra\n"
+    rows = UserService._parse_import_file(_upload(content), content)
+    assert rows == [
+        (2, None, "열 개수가 헤더와 다릅니다"),
+        (3, None, "열 개수가 헤더와 다릅니다"),
+    ]
+
+
+def test_import_reports_short_and_long_rows_per_row():
+    result, repo = _import(
+        HEADER
+        + "000001,김영숙\n"
+        + "000002,김영수,male,1950-03-01,01012345678,extra\n"
+        + "000003,박정희,female,1948-05-02,01087654321\n"
+    )
+
+    assert result["total"] == 3
+    assert result["inserted"] == 1
+    assert [(e["row"], e["code"]) for e in result["errors"]] == [(2, "INVALID_ROW"), (3, "INVALID_ROW")]
+    assert [r[1] for r in repo.records] == ["000003"]
+
+
+def test_import_jsonl_invalid_line():
+    repo = FakeUserRepository()
+    content = '{"member_id": "000001", "name": "김영숙", "gender": "female", "birth": "1950-03-01",' \
+              ' "phone_num": "01012345678"}\n[1, 2]\n'
+    result = asyncio.run(UserService(repo, None).import_users(_upload(content, "members.jsonl")))
+
+    assert result["inserted"] == 1
+    assert [(e["row"], e["code"]) for e in result["errors"]] == [(2, "INVALID_ROW")]